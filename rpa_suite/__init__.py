@@ -68,5 +68,15 @@ Módulos disponíveis:
 
 __version__ = "1.6.5"
 
-# allows importing the rpa_suite module without the package name
-from .suite import rpa
+__all__ = ["rpa"]
+
+
+def __getattr__(name: str):
+    # allows importing the rpa_suite module without the package name; suite.py (and every core module it imports)
+    # is only loaded on the first access to ``rpa``, so importing a single submodule stays cheap
+    if name == "rpa":
+        from .suite import rpa  # pylint: disable=import-outside-toplevel
+
+        globals()["rpa"] = rpa
+        return rpa
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -35,7 +35,7 @@ from .dir import Directory
 from .email import Email
 from .file import File
 from .log import Log
-from .parallel import ParallelRunner
+from .parallel import BatchParallelRunner, ParallelRunner
 from .print import Print
 from .regex import Regex
 from .validate import Validate
@@ -10,7 +10,7 @@ import sqlite3
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 # imports third party
 try:
@@ -32,11 +32,12 @@ from rpa_suite.functions._printer import alert_print, error_print, success_print
 
 # Import condicional para evitar dependência circular
 try:
-    from .log import Log
+    from .log import Log, _code_display_filename
     LOG_AVAILABLE = True
 except ImportError:
     LOG_AVAILABLE = False
     Log = None
+    _code_display_filename = None
 
 
 # ========== ENUMS E CONSTANTES ==========
@@ -64,6 +65,15 @@ DEFAULT_EXECUTIONS_TABLE = "athena_executions"
 DEFAULT_ITEMS_TABLE = "athena_items"
 DEFAULT_LOGS_TABLE = "athena_logs"
 
+# Níveis aceitos por add_log (mesmos do CHECK da tabela de logs)
+VALID_LOG_LEVELS = frozenset({'debug', 'info', 'warning', 'error', 'critical', 'success'})
+
+# Tamanho do lote usado por iter_logs (fetchmany)
+LOGS_FETCH_BATCH_SIZE = 1024
+
+# Caminhos deste arquivo, ignorados na busca do chamador em add_log
+_INTERNAL_FILENAMES = frozenset((__file__, os.path.normpath(__file__)))
+
 
 # ========== EXCEÇÕES CUSTOMIZADAS ==========
 
@@ -97,6 +107,10 @@ class DatabaseAdapter(ABC):
         """Execute query multiple times."""
         pass
 
+    def begin(self) -> None:
+        """Open an explicit transaction (no-op when the driver already does it implicitly)."""
+        pass
+
     @abstractmethod
     def commit(self) -> None:
         """Commit transaction."""
@@ -168,13 +182,20 @@ class SQLiteAdapter(DatabaseAdapter):
         except Exception as e:
             raise DatabaseError(f"Error executing SQLite executemany: {str(e)}.") from e
 
+    def begin(self) -> None:
+        """Abre uma transação explícita (auto-commit fica suspenso até commit/rollback)."""
+        if self.connection and not self.connection.in_transaction:
+            self.connection.execute("BEGIN")
+
     def commit(self) -> None:
-        """SQLite auto-commit está habilitado."""
-        pass
+        """Commit da transação explícita, se houver (auto-commit está habilitado)."""
+        if self.connection and self.connection.in_transaction:
+            self.connection.commit()
 
     def rollback(self) -> None:
-        """SQLite auto-commit está habilitado."""
-        pass
+        """Rollback da transação explícita, se houver (auto-commit está habilitado)."""
+        if self.connection and self.connection.in_transaction:
+            self.connection.rollback()
 
     def close(self) -> None:
         """Fecha conexão SQLite."""
@@ -789,6 +810,8 @@ class Database:
             self.executions_table = executions_table
             self.items_table = items_table
             self.logs_table = logs_table
+            self._get_logs_queries = self._build_get_logs_queries()
+            self._clear_logs_queries = self._build_clear_logs_queries()
             self.allow_reprocess_items = allow_reprocess_interrupted_items
             self.allow_reprocess_executions = allow_reprocess_interrupted_executions
             self.auto_detect = auto_detect_interruptions
@@ -895,6 +918,46 @@ class Database:
         else:
             raise DatabaseError(f"Unsupported database type: {db_type}")
 
+    def _build_get_logs_queries(self) -> Dict[Tuple[bool, bool, bool], str]:
+        """Pre-builds the 8 get_logs queries keyed by (log_level?, step_name?, order_desc)."""
+        queries = {}
+        for has_level in (False, True):
+            for has_step in (False, True):
+                for order_desc in (False, True):
+                    query = f"SELECT * FROM {self.logs_table} WHERE execution_id = ?"
+                    if has_level:
+                        query += " AND log_level = ?"
+                    if has_step:
+                        query += " AND step_name = ?"
+                    query += f" ORDER BY timestamp {'DESC' if order_desc else 'ASC'}"
+                    queries[(has_level, has_step, order_desc)] = query
+        return queries
+
+    def _build_clear_logs_queries(self) -> Dict[Tuple[bool, bool, bool], str]:
+        """Pre-builds the 8 clear_logs queries keyed by (execution_id?, log_level?, older_than_days?)."""
+        # PostgreSQL/MySQL recebem os dias no próprio SQL ({days}); o SQLite recebe como parâmetro
+        if self.db_type == DatabaseType.SQLITE:
+            older_than = " AND timestamp < datetime('now', '-' || ? || ' days')"
+        elif self.db_type == DatabaseType.POSTGRESQL:
+            older_than = " AND timestamp < NOW() - INTERVAL '{days} days'"
+        elif self.db_type == DatabaseType.MYSQL:
+            older_than = " AND timestamp < DATE_SUB(NOW(), INTERVAL {days} DAY)"
+        else:
+            older_than = ""
+        queries = {}
+        for has_execution in (False, True):
+            for has_level in (False, True):
+                for has_age in (False, True):
+                    query = f"DELETE FROM {self.logs_table} WHERE 1=1"
+                    if has_execution:
+                        query += " AND execution_id = ?"
+                    if has_level:
+                        query += " AND log_level = ?"
+                    if has_age:
+                        query += older_than
+                    queries[(has_execution, has_level, has_age)] = query
+        return queries
+
     def _create_tables(self) -> None:
         """Creates tables using the adapter."""
         try:
@@ -2618,9 +2681,19 @@ class Database:
             )
         
         try:
-            self.clear_items_table(confirm=True)
-            self.clear_logs_table(confirm=True)  # Limpa logs antes de execuções
-            self.clear_executions_table(confirm=True)
+            # Uma única transação/commit para as três tabelas
+            if self.db_type == DatabaseType.POSTGRESQL:
+                # RESTART IDENTITY zera os SERIAL como num banco novo; CASCADE inclui tabelas com FK para estas
+                self._adapter.execute_query(
+                    f"TRUNCATE TABLE {self.items_table}, {self.logs_table}, {self.executions_table} "
+                    "RESTART IDENTITY CASCADE"
+                )
+            else:
+                # DELETE sem WHERE: no SQLite ativa a "truncate optimization"
+                self._adapter.begin()
+                for table in (self.items_table, self.logs_table, self.executions_table):
+                    self._adapter.execute_query(f"DELETE FROM {table}")
+            self._adapter.commit()
             return True
             
         except Exception as e:
@@ -2658,59 +2731,74 @@ class Database:
                 exec_data = self.get_execution(execution_id)
                 if not exec_data:
                     return {}
-                
-                items = self.get_items(execution_id)
-                
+
+                # Contagem feita no banco, sem buscar as linhas dos itens
+                items_stats = self._count_by_status(
+                    self.items_table,
+                    ('pending', 'queued', 'processing', 'success', 'failed', 'interrupted'),
+                    execution_id=execution_id
+                )
+                total_items = items_stats.pop('total')
+
                 return {
                     'execution': exec_data,
-                    'total_items': len(items),
-                    'items_by_status': {
-                        status: len([i for i in items if i.get('status') == status])
-                        for status in ['pending', 'queued', 'processing', 'success', 'failed', 'interrupted']
-                    }
+                    'total_items': total_items,
+                    'items_by_status': items_stats
                 }
             else:
                 # Estatísticas gerais
-                exec_query = f"""
-                    SELECT 
-                        COUNT(*) as total,
-                        SUM(CASE WHEN status = 'running' THEN 1 ELSE 0 END) as running,
-                        SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
-                        SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed,
-                        SUM(CASE WHEN status = 'interrupted' THEN 1 ELSE 0 END) as interrupted
-                    FROM {self.executions_table}
-                """
-                exec_cursor = self._adapter.execute_query(exec_query)
-                exec_stats = exec_cursor.fetchone()
-                
-                items_query = f"""
-                    SELECT 
-                        COUNT(*) as total,
-                        SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending,
-                        SUM(CASE WHEN status = 'processing' THEN 1 ELSE 0 END) as processing,
-                        SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) as success,
-                        SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed
-                    FROM {self.items_table}
-                """
-                items_cursor = self._adapter.execute_query(items_query)
-                items_stats = items_cursor.fetchone()
-                
-                if self.db_type == DatabaseType.SQLITE:
-                    return {
-                        'executions': dict(exec_stats),
-                        'items': dict(items_stats)
-                    }
-                else:
-                    exec_dict = dict(exec_stats) if hasattr(exec_stats, 'keys') else {i: v for i, v in enumerate(exec_stats)}
-                    items_dict = dict(items_stats) if hasattr(items_stats, 'keys') else {i: v for i, v in enumerate(items_stats)}
-                    return {
-                        'executions': exec_dict,
-                        'items': items_dict
-                    }
-                    
+                return {
+                    'executions': self._count_by_status(
+                        self.executions_table,
+                        ('running', 'completed', 'failed', 'interrupted')
+                    ),
+                    'items': self._count_by_status(
+                        self.items_table,
+                        ('pending', 'processing', 'success', 'failed')
+                    )
+                }
+
         except Exception as e:
             raise DatabaseError(f"Error fetching statistics: {str(e)}.") from e
 
+    def _count_by_status(
+        self,
+        table: str,
+        statuses: Tuple[str, ...],
+        execution_id: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Conta linhas de uma tabela no total e por status.
+
+        O total é obtido com um COUNT(*) isolado (caminho rápido do banco, sem
+        CASE no plano) e os status com um único GROUP BY; o resultado é montado
+        em Python.
+        """
+        where = " WHERE execution_id = ?" if execution_id else ""
+        params = (execution_id,) if execution_id else None
+
+        cursor = self._adapter.execute_query(f"SELECT COUNT(*) AS total FROM {table}{where}", params)
+        row = cursor.fetchone()
+        if row is None:
+            total = 0
+        else:
+            total = row['total'] if hasattr(row, 'keys') else row[0]
+
+        cursor = self._adapter.execute_query(
+            f"SELECT status, COUNT(*) AS qt FROM {table}{where} GROUP BY status", params
+        )
+        counts = {}
+        for row in cursor.fetchall():
+            if hasattr(row, 'keys'):
+                counts[row['status']] = row['qt']
+            else:
+                counts[row[0]] = row[1]
+
+        result = {'total': total}
+        for status in statuses:
+            result[status] = counts.get(status, 0)
+        return result
+
     # ========== MÉTODOS DE LOGS ==========
 
     def add_log(
@@ -2759,10 +2847,10 @@ class Database:
         --------
         int: ID do log criado
         """
+        if log_level not in VALID_LOG_LEVELS:
+            raise DatabaseError(f"Invalid log level: {log_level}")
+
         try:
-            if log_level not in ['debug', 'info', 'warning', 'error', 'critical', 'success']:
-                raise DatabaseError(f"Invalid log level: {log_level}")
-            
             now = datetime.now()
             
             query = f"""
@@ -2789,7 +2877,7 @@ class Database:
                     
                     # Captura o frame do arquivo que chamou add_log() (não do database.py)
                     caller_frame = None
-                    current_file = os.path.normpath(__file__)
+                    display_filename = None
                     
                     # Percorre a pilha de chamadas para encontrar o primeiro frame que não é do database.py
                     # Começa do frame atual (add_log) e vai para trás
@@ -2797,20 +2885,14 @@ class Database:
                     # Pula o frame atual (add_log) e vai para quem chamou
                     while frame:
                         frame = frame.f_back
-                        if frame:
-                            frame_file = os.path.normpath(frame.f_code.co_filename)
-                            # Se encontrou um frame que não é do database.py, usa ele
-                            if frame_file != current_file:
-                                caller_frame = frame
-                                break
+                        # Se encontrou um frame que não é do database.py, usa ele
+                        if frame and frame.f_code.co_filename not in _INTERNAL_FILENAMES:
+                            caller_frame = frame
+                            display_filename = _code_display_filename(frame.f_code)
+                            break
                     
                     # Se encontrou o caller, extrai filename e lineno
                     if caller_frame:
-                        full_path_filename = caller_frame.f_code.co_filename
-                        full_path_filename = os.path.normpath(full_path_filename)
-                        parent_folder = os.path.basename(os.path.dirname(full_path_filename))
-                        file_name = os.path.basename(full_path_filename)
-                        display_filename = f"{parent_folder}/{file_name}"
                         caller_lineno = caller_frame.f_lineno
                         
                         # Mapeia níveis do Database para níveis do Log
@@ -2912,30 +2994,85 @@ class Database:
         --------
         List[Dict[str, Any]]: Lista de logs
         """
+        return list(
+            self.iter_logs(
+                execution_id,
+                log_level=log_level,
+                step_name=step_name,
+                limit=limit,
+                order_desc=order_desc
+            )
+        )
+
+    def iter_logs(
+        self,
+        execution_id: int,
+        log_level: Optional[str] = None,
+        step_name: Optional[str] = None,
+        limit: Optional[int] = None,
+        order_desc: bool = True,
+        batch_size: int = LOGS_FETCH_BATCH_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre os logs de uma execução sob demanda, em lotes.
+
+        Mesmos filtros de get_logs, mas as linhas são lidas com fetchmany(batch_size)
+        e convertidas em dict uma a uma, então o pico de memória é proporcional ao
+        lote e não ao resultado inteiro.
+
+        Parameters:
+        -----------
+        execution_id: int
+            Execution ID
+
+        log_level: Optional[str]
+            Filtrar por nível de log
+
+        step_name: Optional[str]
+            Filtrar por nome da etapa
+
+        limit: Optional[int]
+            Limitar número de resultados
+
+        order_desc: bool
+            Se True, ordena por timestamp DESC (mais recentes primeiro)
+            Default: True
+
+        batch_size: int
+            Quantidade de linhas buscadas por vez
+            Default: 1024
+
+        Returns:
+        --------
+        Iterator[Dict[str, Any]]: Logs, um por vez
+        """
         try:
-            query = f"SELECT * FROM {self.logs_table} WHERE execution_id = ?"
-            params = [execution_id]
-            
-            if log_level:
-                query += " AND log_level = ?"
-                params.append(log_level)
-            
-            if step_name:
-                query += " AND step_name = ?"
-                params.append(step_name)
-            
-            query += f" ORDER BY timestamp {'DESC' if order_desc else 'ASC'}"
+            query = self._get_logs_queries[(bool(log_level), bool(step_name), bool(order_desc))]
+            
+            if log_level and step_name:
+                params = (execution_id, log_level, step_name)
+            elif log_level:
+                params = (execution_id, log_level)
+            elif step_name:
+                params = (execution_id, step_name)
+            else:
+                params = (execution_id,)
             
             if limit:
-                query += f" LIMIT {limit}"
+                query = f"{query} LIMIT {limit}"
             
-            cursor = self._adapter.execute_query(query, tuple(params))
-            rows = cursor.fetchall()
+            cursor = self._adapter.execute_query(query, params)
+            cursor.arraysize = batch_size
             
-            if self.db_type == DatabaseType.SQLITE:
-                return [dict(row) for row in rows]
-            else:
-                return [dict(row) if hasattr(row, 'keys') else row for row in rows]
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                if self.db_type == DatabaseType.SQLITE:
+                    yield from map(dict, rows)
+                else:
+                    for row in rows:
+                        yield dict(row) if hasattr(row, 'keys') else row
             
         except Exception as e:
             raise DatabaseError(f"Error fetching logs: {str(e)}.") from e
@@ -2991,27 +3128,24 @@ class Database:
             )
         
         try:
-            query = f"DELETE FROM {self.logs_table} WHERE 1=1"
-            params = []
-            
-            if execution_id:
-                query += " AND execution_id = ?"
-                params.append(execution_id)
-            
-            if log_level:
-                query += " AND log_level = ?"
-                params.append(log_level)
+            query = self._clear_logs_queries[(bool(execution_id), bool(log_level), bool(older_than_days))]
+            
+            if execution_id and log_level:
+                params = (execution_id, log_level)
+            elif execution_id:
+                params = (execution_id,)
+            elif log_level:
+                params = (log_level,)
+            else:
+                params = ()
             
             if older_than_days:
                 if self.db_type == DatabaseType.SQLITE:
-                    query += " AND timestamp < datetime('now', '-' || ? || ' days')"
-                    params.append(older_than_days)
-                elif self.db_type == DatabaseType.POSTGRESQL:
-                    query += f" AND timestamp < NOW() - INTERVAL '{older_than_days} days'"
-                elif self.db_type == DatabaseType.MYSQL:
-                    query += f" AND timestamp < DATE_SUB(NOW(), INTERVAL {older_than_days} DAY)"
+                    params = (*params, older_than_days)
+                else:
+                    query = query.format(days=older_than_days)
             
-            cursor = self._adapter.execute_query(query, tuple(params) if params else None)
+            cursor = self._adapter.execute_query(query, params or None)
             
             count = cursor.rowcount if hasattr(cursor, 'rowcount') else 0
             self._adapter.commit()
@@ -5,6 +5,9 @@ import datetime as dt
 from typing import Optional as Op
 from typing import Tuple
 
+# Precomputed zero-padded strings for 0..99 ("00", "01", ..., "99")
+_TWO_DIGIT = tuple(f"{i:02d}" for i in range(100))
+
 
 class DateError(Exception):
     """Custom exception for Date errors."""
@@ -54,34 +57,9 @@ class Date:
         >>> print(f"{hour}:{minute}:{second}")  # Output: "14:30:45"
         """
 
-        # Local Variables
-        hours: str
-        minutes: str
-        seconds: str
-
         try:
-            # Preprocessing
             now = dt.datetime.now()
-            hours: str = str(now.hour) if now.hour >= 10 else f"0{now.hour}"
-            minutes: str = str(now.minute) if now.minute >= 10 else f"0{now.minute}"
-            seconds: str = str(now.second) if now.second >= 10 else f"0{now.second}"
-
-            # Process
-            try:
-                if len(hours) == 3 or len(minutes) == 3 or len(seconds) == 3:
-                    if len(seconds) == 3:
-                        seconds[1:]  # pylint: disable=pointless-statement
-                    if len(minutes) == 3:
-                        minutes[1:]  # pylint: disable=pointless-statement
-                    if len(hours) == 3:
-                        hours[1:]  # pylint: disable=pointless-statement
-
-                return hours, minutes, seconds
-
-            except Exception as e:
-                raise DateError(
-                    f"Error trying process hours, minutes or seconds convert strings: [{hours}, {minutes}, {seconds}]! {str(e)}."
-                ) from e
+            return _TWO_DIGIT[now.hour], _TWO_DIGIT[now.minute], _TWO_DIGIT[now.second]
         except Exception as e:
             raise DateError(f"Error function: {self.get_hms.__name__}! {str(e)}.") from e
 
@@ -103,25 +81,7 @@ class Date:
         >>> print(f"{day}/{month}/{year}")  # Output: "02/11/2024"
         """
         try:
-            # Local Variables
-            day_got: str
-            month_got: str
-            year_got: str
-
-            # Preprocessing
             now = dt.datetime.now()
-
-            # Process
-            try:
-                day_got: str = str(now.day) if now.day >= 10 else f"0{now.day}"
-                month_got: str = str(now.month) if now.month >= 10 else f"0{now.month}"
-                year_got: str = str(now.year) if now.year >= 10 else f"0{now.year}"
-
-                return day_got, month_got, year_got
-
-            except Exception as e:
-                raise DateError(
-                    f"Error trying process day, month or year convert strings: [{day_got}, {month_got}, {year_got}]! {str(e)}."
-                ) from e
+            return _TWO_DIGIT[now.day], _TWO_DIGIT[now.month], str(now.year)
         except Exception as e:
             raise DateError(f"Error in function: {self.get_dmy.__name__}! {str(e)}.") from e
@@ -174,28 +174,27 @@ class Directory:
 
             # Delete dir in this block
             try:
-                # Check if directory exists
-                if os.path.exists(full_path):
+                # Check if delete_files is True
+                if delete_files:
+                    # Delete all files in the directory
+                    shutil.rmtree(full_path)
 
-                    # Check if delete_files is True
-                    if delete_files:
-                        # Delete all files in the directory
-                        shutil.rmtree(full_path)
+                else:
+                    # Delete the directory only
+                    os.rmdir(full_path)
 
-                    else:
-                        # Delete the directory only
-                        os.rmdir(full_path)
+                result["success"] = True
+                result["path_deleted"] = rf"{full_path}"
 
-                    result["success"] = True
-                    result["path_deleted"] = rf"{full_path}"
+                if display_message:
+                    success_print(f"Directory:'{full_path}' successfully deleted.")
 
-                    if display_message:
-                        success_print(f"Directory:'{full_path}' successfully deleted.")
-                else:
-                    result["success"] = False
-                    result["path_deleted"] = None
-                    if display_message:
-                        alert_print(f"Directory:'{full_path}' doesn't exist.")
+            except FileNotFoundError:
+                # Directory doesn't exist (no separate exists() check before deleting)
+                result["success"] = False
+                result["path_deleted"] = None
+                if display_message:
+                    alert_print(f"Directory:'{full_path}' doesn't exist.")
 
             except PermissionError as e:
                 result["success"] = False
@@ -1,12 +1,26 @@
 # rpa_suite/core/email.py
 
 # imports standard
+import base64
+import io
+import mmap
 import os
 import smtplib
-from email import encoders
+import ssl
+import threading
+from collections import OrderedDict
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from email.policy import compat32
+
+# imports third party
+try:
+    import pybase64
+
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
 
 # imports internal
 from rpa_suite.functions._printer import success_print
@@ -20,6 +34,126 @@ class EmailError(Exception):
         super().__init__(f"EmailError: {clean_message}")
 
 
+# base64 encoder for attachments: SIMD (pybase64) when installed, stdlib otherwise
+_b64encode = pybase64.b64encode if PYBASE64_AVAILABLE else base64.b64encode
+
+# Same serialization as msg.as_string() but with the CRLF line endings SMTP requires, so the
+# message can be handed to sendmail as bytes (smtplib sends bytes as-is, without re-encoding)
+_SMTP_POLICY = compat32.clone(linesep="\r\n")
+
+# 57 raw bytes -> one 76-char MIME line; attachments are encoded 1024 lines at a time
+_MIME_LINE_BYTES = 57
+_MIME_LINE_CHARS = 76
+_ATTACHMENT_CHUNK_SIZE = _MIME_LINE_BYTES * 1024
+
+# Attachments above this size are memory-mapped instead of read() chunk by chunk
+_ATTACHMENT_MMAP_THRESHOLD = 8 * 1024 * 1024
+
+# LRU of encoded payloads of recently sent attachments (up to the mmap threshold), keyed by
+# (st_dev, st_ino, st_mtime_ns, st_size) so a modified or replaced file is re-encoded;
+# bounded by the total length of the cached payloads rather than by their count
+_ENCODED_ATTACHMENTS: OrderedDict[tuple, str] = OrderedDict()
+_ENCODED_ATTACHMENTS_MAX_BYTES = 64 * 1024 * 1024
+_encoded_attachments_bytes = 0
+# send_smtp may run on several threads at once; guards the LRU and its byte count (not the encoding itself)
+_ENCODED_ATTACHMENTS_LOCK = threading.Lock()
+
+
+def _get_encoded_attachment(key: tuple) -> str | None:
+    """Returns a cached encoded payload and marks it as the most recently used one."""
+    with _ENCODED_ATTACHMENTS_LOCK:
+        payload = _ENCODED_ATTACHMENTS.get(key)
+        if payload is not None:
+            _ENCODED_ATTACHMENTS.move_to_end(key)
+        return payload
+
+
+def _cache_encoded_attachment(key: tuple, payload: str) -> None:
+    """Stores an encoded payload, evicting the least recently used ones to stay within the byte budget."""
+    global _encoded_attachments_bytes  # pylint: disable=global-statement
+    with _ENCODED_ATTACHMENTS_LOCK:
+        if key in _ENCODED_ATTACHMENTS:  # another thread encoded the same file meanwhile
+            return
+        _ENCODED_ATTACHMENTS[key] = payload
+        _encoded_attachments_bytes += len(payload)
+        while _encoded_attachments_bytes > _ENCODED_ATTACHMENTS_MAX_BYTES:
+            _, evicted = _ENCODED_ATTACHMENTS.popitem(last=False)
+            _encoded_attachments_bytes -= len(evicted)
+
+
+def _write_base64_lines(output: io.BytesIO, chunk: bytes | memoryview) -> None:
+    """Base64-encodes a chunk (a multiple of 57 bytes, except the last one) as 76-char MIME lines."""
+    data = _b64encode(chunk)
+    for start in range(0, len(data), _MIME_LINE_CHARS):
+        output.write(data[start : start + _MIME_LINE_CHARS])
+        output.write(b"\n")
+
+
+def _open_smtp_connection(  # pylint: disable=too-many-positional-arguments
+    smtp_server: str,
+    smtp_port: str | int,
+    email_user: str,
+    email_password: str,
+    auth_tls: bool,
+    ssl_context: ssl.SSLContext | None = None,
+) -> smtplib.SMTP:
+    """Opens an authenticated SMTP connection (STARTTLS when auth_tls is True, SSL otherwise)."""
+    if auth_tls:
+        # Connecting to SMTP server with TLS
+        server = smtplib.SMTP(smtp_server, smtp_port)
+        server.starttls(context=ssl_context)
+    else:
+        # Connecting to SMTP server with SSL
+        server = smtplib.SMTP_SSL(smtp_server, smtp_port, context=ssl_context)
+    server.login(email_user, email_password)
+    return server
+
+
+class SMTPConnectionPool:
+    """
+    Keeps authenticated SMTP connections open so consecutive sends skip the TLS handshake and login.
+
+    Connections are keyed by (smtp_server, smtp_port, email_user, auth_tls). A cached connection is
+    probed with NOOP before being reused; if the server dropped it, it is discarded and a new one is opened.
+    """
+
+    def __init__(self, ssl_context: ssl.SSLContext | None = None) -> None:
+        self._connections: dict[tuple, smtplib.SMTP] = {}
+        self._ssl_context = ssl_context
+
+    def get(  # pylint: disable=too-many-positional-arguments
+        self, smtp_server: str, smtp_port: str | int, email_user: str, email_password: str, auth_tls: bool
+    ) -> smtplib.SMTP:
+        """Returns a live connection for the given server/user, opening one if needed."""
+        key = (smtp_server, smtp_port, email_user, auth_tls)
+        server = self._connections.get(key)
+        if server is not None:
+            try:
+                if server.noop()[0] == 250:
+                    return server
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.discard(key)
+
+        server = _open_smtp_connection(smtp_server, smtp_port, email_user, email_password, auth_tls, self._ssl_context)
+        self._connections[key] = server
+        return server
+
+    def discard(self, key: tuple) -> None:
+        """Closes (silently) and forgets the connection stored under key."""
+        server = self._connections.pop(key, None)
+        if server is not None:
+            try:
+                server.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+
+    def close(self) -> None:
+        """Closes every pooled connection."""
+        for key in list(self._connections):
+            self.discard(key)
+
+
 class Email:
     """
     Class that provides utilities for sending emails via SMTP protocol.
@@ -32,6 +166,8 @@ class Email:
 
     Methods:
         send_smtp: Sends an email through specified SMTP server
+        send_smtp_many: Sends several emails over a reused SMTP connection
+        close: Closes the SMTP connections kept open with keep_alive=True
 
     The Email class is part of RPA Suite and can be accessed through the rpa object:
         >>> from rpa_suite import rpa
@@ -54,6 +190,9 @@ class Email:
     body_message: str = "<p>Testing message body</p>"
     auth_tls: bool = (False,)
 
+    # Shared by every instance: the CA bundle is loaded once per process, not once per connection
+    _ssl_context: ssl.SSLContext | None = None
+
     def __init__(self) -> None:
         """
         Constructor function for the Email class that provides utilities for email management.
@@ -61,6 +200,19 @@ class Email:
         This class offers functionalities for sending emails via SMTP protocol with support
         for attachments, HTML formatting, and various SMTP server configurations.
         """
+        if Email._ssl_context is None:
+            Email._ssl_context = ssl.create_default_context()
+        self._pool = SMTPConnectionPool(self._ssl_context)
+
+    def __enter__(self) -> "Email":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the SMTP connections kept open by ``send_smtp(..., keep_alive=True)``."""
+        self._pool.close()
 
     def send_smtp(  # pylint: disable=too-many-positional-arguments,too-many-locals
         self,
@@ -74,6 +226,7 @@ class Email:
         smtp_port: str = 465,
         auth_tls: bool = False,
         verbose: bool = True,
+        keep_alive: bool = False,
     ):
         """
         Sends an email using the specified SMTP server.
@@ -110,6 +263,11 @@ class Email:
         verbose : bool, optional
             Whether to print success messages. Default: True.
 
+        keep_alive : bool, optional
+            Whether to keep the authenticated connection open and reuse it on the next call with the
+            same server, port, user and auth mode. Call ``close()`` (or use ``with Email() as email:``)
+            to release it. Default: False.
+
         Returns:
         --------
         None
@@ -123,64 +281,133 @@ class Email:
         """
 
         try:
-            self.smtp_server = smtp_server
-            self.smtp_port = smtp_port
-            self.email_user = email_user
-            self.email_password = email_password
-            self.email_to = email_to
-            self.subject_title = subject_title
-            self.body_message = body_message
-            self.attachments = attachments
-            self.auth_tls = auth_tls
-
-            # Creating the message
-            msg = MIMEMultipart()
-            msg["From"] = self.email_user
-            msg["To"] = ", ".join(self.email_to) if isinstance(self.email_to, list) else self.email_to
-            msg["Subject"] = str(self.subject_title)
-
-            # Email body
-            body = str(self.body_message)
-            msg.attach(MIMEText(body, "html"))
-
-            # Attachments (optional)
-            if self.attachments:
-                for attachment_path in self.attachments:
-                    try:
-                        with open(attachment_path, "rb") as attachment:
-                            part = MIMEBase("application", "octet-stream")
-                            part.set_payload(attachment.read())
-                            encoders.encode_base64(part)
-                            part.add_header(
-                                "Content-Disposition",
-                                f"attachment; filename= {os.path.basename(attachment_path)}",
-                            )
-                            msg.attach(part)
-
-                    except Exception as e:
-                        raise EmailError(f"Error attaching file {attachment_path}: {str(e)}") from e
+            msg = self._build_message(email_user, email_to, subject_title, body_message, attachments)
+            # Serialized once, as wire-ready bytes, and reused for every (re)send attempt
+            raw_message = msg.as_bytes(policy=_SMTP_POLICY)
 
             try:
-                if self.auth_tls:
-                    # Connecting to SMTP server with TLS
-                    server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-                    server.starttls()
-                    server.login(self.email_user, self.email_password)
+                if keep_alive:
+                    key = (smtp_server, smtp_port, email_user, auth_tls)
+                    server = self._pool.get(smtp_server, smtp_port, email_user, email_password, auth_tls)
+                    try:
+                        self._send_with(server, email_user, email_to, raw_message)
+                    except smtplib.SMTPServerDisconnected:
+                        # Connection dropped between the NOOP probe and the send: reconnect once
+                        self._pool.discard(key)
+                        server = self._pool.get(smtp_server, smtp_port, email_user, email_password, auth_tls)
+                        self._send_with(server, email_user, email_to, raw_message)
                 else:
-                    # Connecting to SMTP server with SSL
-                    server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port)
-                    server.login(self.email_user, self.email_password)
+                    # The context manager sends QUIT (closing the connection) even if the send fails
+                    with _open_smtp_connection(
+                        smtp_server, smtp_port, email_user, email_password, auth_tls, self._ssl_context
+                    ) as server:
+                        self._send_with(server, email_user, email_to, raw_message)
 
-                # Sending the email
-                server.sendmail(self.email_user, self.email_to, msg.as_string())
                 if verbose:
                     success_print("Email sent successfully!")
 
-                # Closing the connection
-                server.quit()
-
             except Exception as e:
                 raise EmailError(f"Failed to send email: {str(e)}") from e
 
         except Exception as e:
             raise EmailError(f"A general error occurred in the sendmail function: {str(e)}") from e
+
+    def send_smtp_many(self, messages: list[dict], verbose: bool = True) -> None:
+        """
+        Sends several emails reusing the same authenticated SMTP connection(s).
+
+        Parameters:
+        -----------
+        messages : list[dict]
+            Each item holds the keyword arguments of ``send_smtp`` for one email
+            (email_user, email_password, email_to, subject_title, ...).
+
+        verbose : bool, optional
+            Whether to print success messages. Default: True.
+
+        The pooled connections are closed when the batch ends (or fails).
+
+        Raises:
+        -------
+        EmailError
+            If any of the emails could not be sent.
+        """
+        try:
+            for message in messages:
+                self.send_smtp(**{"verbose": verbose, **message, "keep_alive": True})
+        finally:
+            self.close()
+
+    @staticmethod
+    def _build_message(
+        email_user: str,
+        email_to: str | list[str],
+        subject_title: str,
+        body_message: str,
+        attachments: list[str] | None,
+    ) -> MIMEMultipart:
+        """Builds the MIME message (HTML body + optional attachments)."""
+        # Creating the message
+        msg = MIMEMultipart()
+        msg["From"] = email_user
+        msg["To"] = ", ".join(email_to) if isinstance(email_to, list) else email_to
+        msg["Subject"] = subject_title
+
+        # Email body
+        msg.attach(MIMEText(body_message, "html"))
+
+        # Attachments (optional)
+        if attachments:
+            for attachment_path in attachments:
+                try:
+                    msg.attach(Email._build_attachment(attachment_path))
+                except Exception as e:
+                    raise EmailError(f"Error attaching file {attachment_path}: {str(e)}") from e
+
+        return msg
+
+    @staticmethod
+    def _build_attachment(attachment_path: str) -> MIMEBase:
+        """
+        Builds a base64 attachment part, encoding the file in chunks of whole MIME lines
+        (57 raw bytes -> 76 chars) so the raw file is never loaded into memory as a whole.
+        The same unchanged file sent again reuses its encoded payload instead of being re-read.
+        """
+        with open(attachment_path, "rb") as attachment:
+            stat = os.fstat(attachment.fileno())
+            key = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            payload = _get_encoded_attachment(key)
+            if payload is None:
+                payload = Email._encode_attachment(attachment, stat.st_size)
+                if stat.st_size <= _ATTACHMENT_MMAP_THRESHOLD:
+                    _cache_encoded_attachment(key, payload)
+
+        part = MIMEBase("application", "octet-stream")
+        part.set_payload(payload)
+        part["Content-Transfer-Encoding"] = "base64"
+        part.add_header(
+            "Content-Disposition",
+            f"attachment; filename= {os.path.basename(attachment_path)}",
+        )
+        return part
+
+    @staticmethod
+    def _encode_attachment(attachment, size: int) -> str:
+        """Base64-encodes an open attachment file as MIME lines."""
+        encoded = io.BytesIO()
+        if size > _ATTACHMENT_MMAP_THRESHOLD:
+            # Large files: let the OS page the file in; slices of the mapping are zero-copy
+            with mmap.mmap(attachment.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    for start in range(0, size, _ATTACHMENT_CHUNK_SIZE):
+                        _write_base64_lines(encoded, view[start : start + _ATTACHMENT_CHUNK_SIZE])
+        else:
+            while chunk := attachment.read(_ATTACHMENT_CHUNK_SIZE):
+                _write_base64_lines(encoded, chunk)
+        return encoded.getvalue().decode("ascii")
+
+    @staticmethod
+    def _send_with(server: smtplib.SMTP, email_user: str, email_to: str | list[str], raw_message: bytes) -> None:
+        """Sends an already serialized message through an open SMTP connection."""
+        # Sending the email
+        server.sendmail(email_user, email_to, raw_message)
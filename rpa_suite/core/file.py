@@ -3,16 +3,14 @@
 # imports standard
 import os
 import time
-from datetime import datetime
-from typing import Dict, List, Union
-
-# imports third party
-from colorama import Fore
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import Dict, Iterable, List, Union
 
 from rpa_suite.functions.__create_ss_dir import __create_ss_dir as create_ss_dir
 
 # imports internal
-from rpa_suite.functions._printer import alert_print, success_print
+from rpa_suite.functions._printer import Colors, alert_print, success_print
 
 
 class FileError(Exception):
@@ -23,6 +21,52 @@ class FileError(Exception):
         super().__init__(f"FileError: {clean_message}")
 
 
+_pyautogui = None
+
+
+def _get_pyautogui():
+    """
+    Imports pyautogui (and checks pyscreeze/Pillow) on first use and keeps the module for later calls.
+    """
+    global _pyautogui  # pylint: disable=global-statement
+    if _pyautogui is None:
+        try:  # only to check if opencv, pillow allowed and installed
+            import pyautogui  # pylint: disable=import-outside-toplevel
+            import pyscreeze  # pylint: disable=unused-import,import-outside-toplevel
+
+        except ImportError as e:
+            raise ImportError(
+                f"\nThe 'pyautogui' e 'Pillow' libraries are necessary to use this module. {Colors.yellow}Please install them with: 'pip install pyautogui pillow'{Colors.default}"
+            ) from e
+        _pyautogui = pyautogui
+    return _pyautogui
+
+
+def _count_files_in(directory: str, suffix: str | tuple[str, ...] | None) -> int:
+    """
+    Counts the files under ``directory`` (recursively) whose name ends with ``suffix`` (all files if None).
+    ``suffix`` may be a tuple, matched in a single ``str.endswith`` call.
+
+    Uses ``os.scandir`` so the file type comes from the cached directory entry, and an explicit stack
+    of pending directories instead of recursion (no Python frame per tree level, no depth limit).
+    Like ``os.walk``, symlinked directories are not followed and unreadable directories are skipped.
+    """
+    total = 0
+    pending = [directory]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            pending.append(entry.path)
+                    elif suffix is None or entry.name.endswith(suffix):
+                        total += 1
+        except OSError:
+            continue
+    return total
+
+
 class File:
     """
     Class for file management utilities: create/delete flag files, count files in directories, and take screenshots.
@@ -98,14 +142,7 @@ class File:
         # proccess
         try:
 
-            try:  # only to check if opencv, pillow allowed and installed
-                import pyautogui  # pylint: disable=import-outside-toplevel
-                import pyscreeze  # pylint: disable=unused-import,import-outside-toplevel
-
-            except ImportError as e:
-                raise ImportError(
-                    f"\nThe 'pyautogui' e 'Pillow' libraries are necessary to use this module. {Fore.YELLOW}Please install them with: 'pip install pyautogui pillow'{Fore.WHITE}"
-                ) from e
+            pyautogui = _get_pyautogui()
 
             time.sleep(delay)
 
@@ -118,10 +155,10 @@ class File:
 
             if save_with_date:  # use date on file name
                 image = pyautogui.screenshot()
-                file_name = f'{file_name}_{datetime.today().strftime("%d_%m_%Y-%H_%M_%S")}.png'
+                file_name = f'{file_name}_{time.strftime("%d_%m_%Y-%H_%M_%S")}.png'
                 path_file_screenshoted = os.path.join(path_dir, file_name)
 
-                image.save(path_file_screenshoted)
+                image.save(path_file_screenshoted, format="PNG", compress_level=1, optimize=False)
 
                 if verbose:
                     success_print(path_file_screenshoted)
@@ -132,7 +169,7 @@ class File:
             file_name = f"{file_name}.png"
             path_file_screenshoted = os.path.join(path_dir, file_name)
 
-            image.save(path_file_screenshoted)
+            image.save(path_file_screenshoted, format="PNG", compress_level=1, optimize=False)
 
             if verbose:
                 success_print(path_file_screenshoted)
@@ -148,7 +185,7 @@ class File:
         verbose: bool = True,
     ) -> None:
         """
-        Creates a flag file to indicate the robot is running.
+        Creates a flag file to indicate the robot is running. An existing flag file is left untouched.
 
         Parameters:
         -----------
@@ -173,14 +210,21 @@ class File:
         """
 
         try:
-            if path_to_create is None:
-                path_origin: str = os.getcwd()
-                full_path_with_name = rf"{path_origin}/{name_file}"
-            else:
-                full_path_with_name = rf"{path_to_create}/{name_file}"
+            # No path: a relative name is resolved against the current directory by the OS itself
+            full_path_with_name = name_file if path_to_create is None else os.path.join(path_to_create, name_file)
 
-            with open(full_path_with_name, "w", encoding="utf-8") as file:
-                file.write("[RPA Suite] - Running Flag File")
+            # O_EXCL: atomic create, an existing flag is never overwritten
+            try:
+                fd = os.open(full_path_with_name, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                if verbose:
+                    alert_print("Flag file already exists.")
+                return
+
+            try:
+                os.write(fd, b"[RPA Suite] - Running Flag File")
+            finally:
+                os.close(fd)
             if verbose:
                 success_print("Flag file created.")
 
@@ -220,18 +264,17 @@ class File:
 
         try:
 
-            if path_to_delete is None:
-                path_origin: str = os.getcwd()
-                full_path_with_name = rf"{path_origin}/{name_file}"
-            else:
-                full_path_with_name = rf"{path_to_delete}/{name_file}"
+            # No path: a relative name is resolved against the current directory by the OS itself
+            full_path_with_name = name_file if path_to_delete is None else os.path.join(path_to_delete, name_file)
 
-            if os.path.exists(full_path_with_name):
-                os.remove(full_path_with_name)
-                if verbose:
-                    success_print("Flag file deleted.")
-            else:
+            try:
+                os.unlink(full_path_with_name)
+            except FileNotFoundError:
                 alert_print("Flag file not found.")
+                return
+
+            if verbose:
+                success_print("Flag file deleted.")
 
         except Exception as e:
             raise FileError(f"Error in function file_scheduling_delete: {str(e)}") from e
@@ -239,7 +282,7 @@ class File:
     def count_files(
         self,
         dir_to_count: List[str] | None = None,
-        type_extension: str = "*",
+        type_extension: str | Iterable[str] = "*",
         verbose: bool = False,
     ) -> Dict[str, Union[bool, int]]:
         """
@@ -251,8 +294,9 @@ class File:
             List of directory paths to count files in. If None or empty, counts in current directory.
             Default: None.
 
-        type_extension : str, optional
-            File extension to filter by (e.g., 'txt', 'pdf'). Use "*" to count all files.
+        type_extension : str | Iterable[str], optional
+            File extension to filter by (e.g., 'txt', 'pdf'), or several extensions at once
+            (e.g., ['txt', 'pdf', 'csv']) counted in a single pass. Use "*" to count all files.
             Default: "*".
 
         verbose : bool, optional
@@ -275,6 +319,7 @@ class File:
         >>> file_util = File()
         >>> result = file_util.count_files(['./myfolder'], type_extension='txt')
         >>> print(result['qt'])  # Number of .txt files found
+        >>> file_util.count_files(['./myfolder'], type_extension=['txt', 'csv'])['qt']  # .txt + .csv files
         """
 
         # Local Variables
@@ -286,11 +331,18 @@ class File:
             if not dir_to_count:
                 dir_to_count = ["."]
 
-            for directory in dir_to_count:
-                for _, _, files in os.walk(directory):
-                    for file in files:
-                        if type_extension == "*" or file.endswith(f".{type_extension}"):
-                            result["qt"] += 1
+            if isinstance(type_extension, str):
+                suffix = None if type_extension == "*" else f".{type_extension}"
+            else:
+                extensions = tuple(type_extension)
+                suffix = None if "*" in extensions else tuple(f".{extension}" for extension in extensions)
+
+            if len(dir_to_count) == 1:
+                result["qt"] = _count_files_in(dir_to_count[0], suffix)
+            else:
+                # I/O bound: scandir/stat release the GIL, so each root is walked in its own thread
+                with ThreadPoolExecutor(max_workers=min(32, len(dir_to_count))) as executor:
+                    result["qt"] = sum(executor.map(_count_files_in, dir_to_count, repeat(suffix)))
             result["success"] = True
 
             if verbose:
@@ -1,8 +1,9 @@
 # rpa_suite/core/log.py
 
 # imports internal
-import inspect
+import functools
 import os
+import re
 import sys
 import traceback
 
@@ -12,108 +13,137 @@ from typing import Optional as Op
 # imports third party
 from loguru import logger
 
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 from rpa_suite.functions._printer import alert_print, success_print
 
+# Loguru format shared by the log sinks (built once at import, not per config_logger call)
+LOG_FORMAT = "<green>{time:DD.MM.YY.HH:mm}</green> <level>{level: <8}</level> <green>{extra[filename]}</green>:<cyan>{extra[lineno]: <4}</cyan> <level>{message}</level>"
 
-class LogFiltersError(Exception):
-    """Custom exception for LogFilters errors."""
+# Loguru's numbers for the levels used by Log, to drop records below every sink's level before doing any work
+_LEVEL_NO = {"DEBUG": 10, "INFO": 20, "SUCCESS": 25, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
 
-    def __init__(self, message: str) -> None:
-        if not message:
-            message = "Generic error raised!"
-        clean_message = message.replace("LogFiltersError:", "").strip()
-        super().__init__(f"LogFiltersError: {clean_message}")
+# Log directories already created by config_logger in this process
+_ENSURED_DIRS: set[str] = set()
 
+# Bound loggers kept per Log instance (one per logging call site) before the cache is reset
+_BOUND_LOGGERS_MAX_SIZE = 4096
 
-class LogCustomHandlerError(Exception):
-    """Custom exception for LogCustomHandler errors."""
+# Levels that get the active traceback appended when enable_traceback is set
+_TRACEBACK_LEVELS = frozenset(("ERROR", "CRITICAL"))
 
-    def __init__(self, message: str) -> None:
-        if not message:
-            message = "Generic error raised!"
-        clean_message = message.replace("LogCustomHandlerError:", "").strip()
-        super().__init__(f"LogCustomHandlerError: {clean_message}")
+# str.translate table escaping "<" and ">" in tracebacks, so the colorizer does not read them as tags
+_TB_ESCAPE = str.maketrans({"<": "\\<", ">": "\\>"})
 
+# Filenames this module's frames report, skipped when looking for the caller of _log
+_INTERNAL_FILENAMES = frozenset((__file__, os.path.normpath(__file__)))
 
-class LogCustomFormatterError(Exception):
-    """Custom exception for LogCustomFormatter errors."""
+# From this many filtered words on, Filters uses an Aho-Corasick automaton (pyahocorasick) when installed
+AHOCORASICK_MIN_WORDS = 200
 
-    def __init__(self, message: str) -> None:
-        if not message:
-            message = "Generic error raised!"
-        clean_message = message.replace("LogCustomFormatterError:", "").strip()
-        super().__init__(f"LogCustomFormatterError: {clean_message}")
 
+@functools.lru_cache(maxsize=512)
+def _display_filename(co_filename: str) -> str:
+    """Returns the "folder/file.py" shown in log lines for a code filename (cached and interned per filename)."""
+    full_path_filename = os.path.normpath(co_filename)
+    parent_folder = os.path.basename(os.path.dirname(full_path_filename))
+    file_name = os.path.basename(full_path_filename)
+    return sys.intern(f"{parent_folder}/{file_name}")
 
-class LogError(Exception):
-    """Custom exception for Log errors."""
 
-    def __init__(self, message: str) -> None:
-        if not message:
-            message = "Generic error raised!"
-        clean_message = message.replace("LogError:", "").strip()
-        super().__init__(f"LogError: {clean_message}")
+# (code object, display filename) per id(code): the code object is kept referenced, so its id is not reused
+_CODE_DISPLAY_FILENAMES: dict[int, tuple] = {}
+_CODE_DISPLAY_FILENAMES_MAX_SIZE = 4096
 
 
-class Filters:
-    """
-    Filter class for log messages based on word filtering.
-    """
+def _code_display_filename(code) -> str:
+    """Returns ``_display_filename`` for a code object, memoized per code object (one dict lookup per log)."""
+    entry = _CODE_DISPLAY_FILENAMES.get(id(code))
+    if entry is None:
+        if len(_CODE_DISPLAY_FILENAMES) >= _CODE_DISPLAY_FILENAMES_MAX_SIZE:
+            _CODE_DISPLAY_FILENAMES.clear()
+        entry = (code, _display_filename(code.co_filename))
+        _CODE_DISPLAY_FILENAMES[id(code)] = entry
+    return entry[1]
 
-    word_filter: Op[list[str]]
 
-    def __call__(self, record: dict[str, str]) -> bool:
-        try:
-            if self.word_filter and len(self.word_filter) > 0:
-                message = record["message"]
-                for words in self.word_filter:
-                    string_words: list[str] = [str(word) for word in words]
-                    for word in string_words:
-                        if word in message:
-                            record["message"] = message.replace(word, "***")
-                return True
-            return True
-        except Exception as e:
-            raise LogFiltersError(f"Error trying execute: {self.__call__.__name__}! {str(e)}.") from e
+def _not_run_separator(record: dict) -> bool:
+    """Console sink filter: the blank run separator of ``log_start_run_debug`` only goes to the log file."""
+    return "run_separator" not in record["extra"]
 
 
-class CustomHandler:
-    """
-    Custom handler for log messages with formatting capabilities.
-    """
+class LogError(Exception):
+    """Custom exception for Log errors (callers pass the message with its "LogError: " prefix)."""
 
-    def __init__(self, formatter) -> None:
-        self.formatter = formatter
+    __slots__ = ()
 
-    def write(self, message) -> None:
-        try:
-            frame = inspect.currentframe().f_back.f_back
-            log_msg = self.formatter.format(message, frame)
-            sys.stderr.write(log_msg)
-        except Exception as e:
-            raise LogCustomHandlerError(f"Error trying execute: {self.write.__name__}! {str(e)}.") from e
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
 
 
-class CustomFormatter:
+class Filters:
     """
-    Custom formatter for log messages with specific formatting rules.
+    Filter class for log messages based on word filtering.
+
+    The filtered words are compiled once (when ``word_filter`` is set) into a single
+    alternation pattern, so each record costs one regex scan instead of one substring
+    search per word. Large word lists use an Aho-Corasick automaton instead when
+    ``pyahocorasick`` is installed, keeping the scan linear in the message length.
     """
 
-    def format(self, record) -> str:
-        try:
-            filename = record["extra"].get("filename", "")
-            lineno = record["extra"].get("lineno", "")
-            format_string = "<green>{time:DD.MM.YY.HH:mm}</green> <level>{level: <8}</level> <green>{filename}</green>:<cyan>{lineno: <4}</cyan> <level>{message}</level>\n"
-            log_msg = format_string.format(
-                time=record["time"],
-                level=record["level"].name,
-                filename=filename,
-                lineno=lineno,
-                message=record["message"],
-            )
-            return log_msg
-        except Exception as e:
-            raise LogCustomFormatterError(f"Error trying execute: {self.format.__name__}! {str(e)}.") from e
+    _pattern: Op[re.Pattern] = None
+    _automaton = None
+
+    def __init__(self, word_filter: Op[list] = None) -> None:
+        self.word_filter = word_filter
+
+    @property
+    def word_filter(self) -> Op[list]:
+        return self._word_filter
+
+    @word_filter.setter
+    def word_filter(self, value: Op[list]) -> None:
+        self._word_filter = value
+        self._pattern = None
+        self._automaton = None
+        words = set()
+        for group in value or ():
+            words.update(str(word) for word in group if str(word))
+        if AHOCORASICK_AVAILABLE and len(words) >= AHOCORASICK_MIN_WORDS:
+            automaton = ahocorasick.Automaton()
+            for word in words:
+                automaton.add_word(word, len(word))
+            automaton.make_automaton()
+            self._automaton = automaton
+        elif words:
+            # longest first, so a word that contains another one is masked as a whole
+            alternatives = sorted(words, key=len, reverse=True)
+            self._pattern = re.compile("|".join(map(re.escape, alternatives)))
+
+    def _mask(self, message: str) -> str:
+        """Replaces the automaton matches (leftmost, longest, non-overlapping) with "***"."""
+        parts = []
+        start = 0
+        for end_index, length in self._automaton.iter_long(message):
+            parts.append(message[start : end_index + 1 - length])
+            parts.append("***")
+            start = end_index + 1
+        if not parts:
+            return message
+        parts.append(message[start:])
+        return "".join(parts)
+
+    def __call__(self, record: dict[str, str]) -> bool:
+        if self._pattern is not None:
+            record["message"] = self._pattern.sub("***", record["message"])
+        elif self._automaton is not None:
+            record["message"] = self._mask(record["message"])
+        return True
 
 
 class Log:
@@ -122,8 +152,6 @@ class Log:
     """
 
     filters: Filters
-    custom_handler: CustomHandler
-    custom_formatter: CustomFormatter
     path_dir: str | None = None
     name_file_log: str | None = None
     full_path: str | None = None
@@ -136,8 +164,9 @@ class Log:
         """
         try:
             self.logger = logger
+            self._bound_loggers = {}
         except Exception as e:
-            raise LogError(f"Error trying execute: {self.__init__.__name__}! {str(e)}.") from e
+            raise LogError(f"LogError: Error trying execute: {self.__init__.__name__}! {str(e)}.") from e
 
     def config_logger(  # pylint: disable=too-many-positional-arguments
         self,
@@ -147,6 +176,9 @@ class Log:
         filter_words: list[str] = None,
         verbose: bool = False,
         enable_traceback: bool = False,
+        rotation: str | int | None = None,
+        compression: str | None = None,
+        buffering: int = 1,
     ) -> str:
         """
         Configure the logger with specified parameters.
@@ -158,6 +190,10 @@ class Log:
             filter_words: List of words to filter from logs
             verbose: Whether to display configuration messages
             enable_traceback: Whether to include traceback in error logs
+            rotation: When to start a new log file, e.g. "50 MB" or "1 day" (None keeps a single file)
+            compression: Format for rotated files, e.g. "gz" or "zip" (None keeps them uncompressed)
+            buffering: File buffer size; 1 flushes every line, larger values (e.g. 65536) batch the
+                disk writes at the cost of losing the unflushed lines if the process is killed
         """
         try:
             self.path_dir = path_dir
@@ -171,49 +207,57 @@ class Log:
             self.full_path = full_path
 
             try:
-                os.makedirs(self.full_path, exist_ok=True)
+                # Known directories skip the makedirs syscall (Loguru recreates a missing one when it opens the file)
+                if self.full_path not in _ENSURED_DIRS:
+                    os.makedirs(self.full_path, exist_ok=True)
+                    _ENSURED_DIRS.add(self.full_path)
                 if verbose:
                     success_print(f"Directory:'{self.full_path}' was created successfully.")
             except FileExistsError:
                 if verbose:
                     alert_print(f"Directory:'{self.full_path}' already exists.")
             except PermissionError as e:
-                raise LogError(f"Permission denied: cannot create directory '{self.full_path}'! {str(e)}.") from e
+                raise LogError(
+                    f"LogError: Permission denied: cannot create directory '{self.full_path}'! {str(e)}."
+                ) from e
 
+            # No words to mask: no filter callable on the file sink, so Loguru skips that call per record
             new_filter = None
-            if filter_words is not None:
-                new_filter = Filters()
-                new_filter.word_filter = [filter_words]
+            if filter_words:
+                new_filter = Filters([filter_words])
+                if new_filter._pattern is None and new_filter._automaton is None:
+                    new_filter = None
 
             file_handler = os.path.join(self.full_path, f"{self.name_file_log}.log")
             self.logger.remove()
 
-            log_format = "<green>{time:DD.MM.YY.HH:mm}</green> <level>{level: <8}</level> <green>{extra[filename]}</green>:<cyan>{extra[lineno]: <4}</cyan> <level>{message}</level>"
-
-            formatter = CustomFormatter()
-
-            if new_filter:
-                self.logger.add(file_handler, filter=new_filter, level="DEBUG", format=log_format)
-            else:
-                self.logger.add(file_handler, level="DEBUG", format=log_format)
-
-            self.logger.add(sys.stderr, level="DEBUG", format=formatter.format)
+            # Same static format for both sinks; enqueue=True moves the file writes to Loguru's worker thread
+            self.logger.add(
+                file_handler,
+                filter=new_filter,
+                level="DEBUG",
+                format=LOG_FORMAT,
+                enqueue=True,
+                rotation=rotation,
+                compression=compression,
+                buffering=buffering,
+                encoding="utf-8",
+            )
+            self.logger.add(sys.stderr, filter=_not_run_separator, level="DEBUG", format=LOG_FORMAT)
             self.file_handler = file_handler
             return file_handler
 
+        except LogError:
+            raise
         except Exception as e:
-            raise LogError(f"Error trying execute: {self.config_logger.__name__}! {str(e)}.") from e
+            raise LogError(f"LogError: Error trying execute: {self.config_logger.__name__}! {str(e)}.") from e
 
     def _escape_traceback(self, tb_string: str) -> str:
         """
         Escape special characters in traceback to avoid conflicts with Loguru colorizer.
         """
-        try:
-            # Escape characters that might be interpreted as color tags
-            escaped = tb_string.replace("<", "\\<").replace(">", "\\>")
-            return escaped
-        except Exception as e:
-            raise LogError(f"Error trying execute: {self._escape_traceback.__name__}! {str(e)}.") from e
+        # Escape characters that might be interpreted as color tags (one pass over the string)
+        return tb_string.translate(_TB_ESCAPE)
 
     def _log(self, level: str, msg: str, custom_filename: Op[str] = None, custom_lineno: Op[int] = None) -> None:
         """
@@ -234,48 +278,70 @@ class Log:
         custom_lineno : Optional[int]
             Custom line number to display (optional, used when called via Database)
         """
-        try:
-            # Se filename e lineno customizados foram fornecidos, usa eles
-            if custom_filename is not None and custom_lineno is not None:
-                display_filename = custom_filename
-                lineno = custom_lineno
-            else:
-                # Find the first frame that's not from this log.py file
-                frame = inspect.currentframe()
-                current_file = os.path.normpath(__file__)
-
-                while frame:
-                    frame = frame.f_back
-                    if frame and os.path.normpath(frame.f_code.co_filename) != current_file:
-                        break
-
-                if not frame:
-                    # Fallback if we can't find external caller
-                    frame = inspect.currentframe().f_back.f_back
-
-                full_path_filename = frame.f_code.co_filename
-                full_path_filename = os.path.normpath(full_path_filename)
-                parent_folder = os.path.basename(os.path.dirname(full_path_filename))
-                file_name = os.path.basename(full_path_filename)
-                display_filename = f"{parent_folder}/{file_name}"
-                lineno = frame.f_lineno
-
-            # IF TRACEBACK IS ENABLED AND IT'S ERROR LEVEL, ADD TRACEBACK
-            if self.enable_traceback and level in ["ERROR", "CRITICAL"]:
-                try:
-                    # Capture current traceback if there's an active exception
-                    tb_string = traceback.format_exc()
-                    if tb_string != "NoneType: None\n":  # Check if there's real traceback
-                        # ESCAPE SPECIAL CHARACTERS IN TRACEBACK
-                        escaped_traceback = self._escape_traceback(tb_string)
-                        msg = f"{msg}\n{escaped_traceback}"
-                except Exception:
-                    # If can't capture traceback, continue normally
-                    pass
-
-            self.logger.bind(filename=display_filename, lineno=lineno).log(level, msg)
-        except Exception as e:
-            raise LogError(f"Error trying execute: {self._log.__name__}! {str(e)}.") from e
+        if not self._is_enabled_for(level):
+            return
+
+        # Se filename e lineno customizados foram fornecidos, usa eles
+        if custom_filename is not None and custom_lineno is not None:
+            display_filename = custom_filename
+            lineno = custom_lineno
+        else:
+            # Find the first frame that's not from this log.py file
+            frame = sys._getframe(1)  # pylint: disable=protected-access
+            while frame and frame.f_code.co_filename in _INTERNAL_FILENAMES:
+                frame = frame.f_back
+
+            if not frame:
+                # Fallback if we can't find external caller
+                frame = sys._getframe(1)  # pylint: disable=protected-access
+
+            display_filename = _code_display_filename(frame.f_code)
+            lineno = frame.f_lineno
+
+        self._emit(level, msg, display_filename, lineno)
+
+    def _log_fast(self, level: str, msg: str, args: tuple = (), kwargs: Op[dict] = None) -> None:
+        """
+        Same as ``_log`` for the public ``log_*`` methods, whose caller is always two frames up,
+        so the caller is read directly instead of walking the stack.
+
+        ``args``/``kwargs`` are applied with ``msg.format`` only after the level check, so a
+        disabled ``log_debug("value={}", x)`` costs no string formatting.
+        """
+        if not self._is_enabled_for(level):
+            return
+        if args or kwargs:
+            msg = msg.format(*args, **kwargs)
+        frame = sys._getframe(2)  # pylint: disable=protected-access
+        self._emit(level, msg, _code_display_filename(frame.f_code), frame.f_lineno)
+
+    def _is_enabled_for(self, level: str) -> bool:
+        """Whether any sink would accept ``level`` (Loguru keeps the lowest sink level up to date)."""
+        min_level = getattr(self.logger._core, "min_level", 0)  # pylint: disable=protected-access
+        return _LEVEL_NO.get(level, min_level) >= min_level
+
+    def _emit(self, level: str, msg: str, display_filename: str, lineno: int) -> None:
+        """Appends the traceback when enabled and hands the record to Loguru."""
+        # IF TRACEBACK IS ENABLED AND IT'S ERROR LEVEL, ADD TRACEBACK
+        # (only formatted when there is an active exception; sys.exc_info() is a cheap check)
+        if self.enable_traceback and level in _TRACEBACK_LEVELS and sys.exc_info()[0] is not None:
+            try:
+                # Capture current traceback and escape special characters
+                escaped_traceback = self._escape_traceback(traceback.format_exc())
+                msg = f"{msg}\n{escaped_traceback}"
+            except Exception:
+                # If can't capture traceback, continue normally
+                pass
+
+        # One bound logger per call site (filename, lineno), instead of a new bind() for every record
+        key = (display_filename, lineno)
+        entry = self._bound_loggers.get(key)
+        if entry is None or entry[0] is not self.logger:
+            if len(self._bound_loggers) >= _BOUND_LOGGERS_MAX_SIZE:
+                self._bound_loggers.clear()
+            entry = (self.logger, self.logger.bind(filename=display_filename, lineno=lineno))
+            self._bound_loggers[key] = entry
+        entry[1].log(level, msg)
 
     def _log_with_context(self, level: str, msg: str, filename: str, lineno: int) -> None:
         """
@@ -305,30 +371,30 @@ class Log:
         Log a debug message to start a new run session.
         """
         try:
-            with open(self.file_handler, "a", encoding="utf-8") as log_file:
-                log_file.write("\n")
-            self._log("DEBUG", msg_start_loggin)
+            # Blank separator line written through the file sink Loguru already keeps open (not to the console)
+            self.logger.bind(run_separator=True).opt(raw=True).log("DEBUG", "\n")
+            self._log_fast("DEBUG", msg_start_loggin)
         except Exception as e:
             raise LogError(
-                f"Error trying execute: {self.log_start_run_debug.__name__}! see log directory and configuration to config_logger: {str(e)}."
+                f"LogError: Error trying execute: {self.log_start_run_debug.__name__}! see log directory and configuration to config_logger: {str(e)}."
             ) from e
 
-    def log_debug(self, msg: str) -> None:
-        """Log a debug level message."""
-        self._log("DEBUG", msg)
+    def log_debug(self, msg: str, *args, **kwargs) -> None:
+        """Log a debug level message (``msg.format(*args, **kwargs)`` only runs if the level is enabled)."""
+        self._log_fast("DEBUG", msg, args, kwargs)
 
-    def log_info(self, msg: str) -> None:
-        """Log an info level message."""
-        self._log("INFO", msg)
+    def log_info(self, msg: str, *args, **kwargs) -> None:
+        """Log an info level message (``msg.format(*args, **kwargs)`` only runs if the level is enabled)."""
+        self._log_fast("INFO", msg, args, kwargs)
 
-    def log_warning(self, msg: str) -> None:
-        """Log a warning level message."""
-        self._log("WARNING", msg)
+    def log_warning(self, msg: str, *args, **kwargs) -> None:
+        """Log a warning level message (``msg.format(*args, **kwargs)`` only runs if the level is enabled)."""
+        self._log_fast("WARNING", msg, args, kwargs)
 
-    def log_error(self, msg: str) -> None:
-        """Log an error level message."""
-        self._log("ERROR", msg)
+    def log_error(self, msg: str, *args, **kwargs) -> None:
+        """Log an error level message (``msg.format(*args, **kwargs)`` only runs if the level is enabled)."""
+        self._log_fast("ERROR", msg, args, kwargs)
 
-    def log_critical(self, msg: str) -> None:
-        """Log a critical level message."""
-        self._log("CRITICAL", msg)
+    def log_critical(self, msg: str, *args, **kwargs) -> None:
+        """Log a critical level message (``msg.format(*args, **kwargs)`` only runs if the level is enabled)."""
+        self._log_fast("CRITICAL", msg, args, kwargs)
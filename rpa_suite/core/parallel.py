@@ -1,16 +1,26 @@
 # rpa_suite/core/parallel.py
 
 # imports standard
+import os
+import pickle
+import queue
+import threading
 import time
 import traceback
-from multiprocessing import Manager, Process
-from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from multiprocessing import connection, get_context, resource_tracker, shared_memory
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, TypeVar
 
 from rpa_suite.functions._printer import alert_print, error_print, success_print
 
 # Define a generic type for the function return
 T = TypeVar("T")
 
+# bytes/bytearray results can be handed over through shared memory instead of the pipe; POSIX only,
+# since a Windows segment disappears as soon as the child closes it, before the parent can attach
+SHM_RESULTS_SUPPORTED = os.name == "posix"
+
 
 class ParallelRunnerError(Exception):
     """
@@ -73,7 +83,15 @@ class ParallelRunner(Generic[T]):
 
     verbose = None
 
-    def __init__(self, verbose: bool = False) -> None:
+    def __init__(  # pylint: disable=too-many-positional-arguments
+        self,
+        verbose: bool = False,
+        result_in_shm: bool = False,
+        reuse_process: bool = False,
+        start_method: Optional[str] = None,
+        capture_traceback: bool = True,
+        use_thread: bool = False,
+    ) -> None:
         """
         Class responsible for executing functions in parallel processes, allowing the main application flow to continue while the function runs in the background.
 
@@ -82,6 +100,18 @@ class ParallelRunner(Generic[T]):
         Args:
         ----------
             verbose (bool): If True, displays debug messages during execution.
+            result_in_shm (bool): If True, a bytes/bytearray result is copied into a shared memory block
+                instead of being pickled through the pipe (POSIX only; ignored elsewhere).
+            reuse_process (bool): If True, runs go to a single worker process kept alive between run() calls,
+                paying the process start-up only once (results always travel pickled; result_in_shm is ignored).
+            start_method (str): multiprocessing start method ("fork", "forkserver" or "spawn"); None uses the
+                platform default. "fork" (POSIX only) starts the child without a new interpreter and without
+                pickling the function and its arguments.
+            capture_traceback (bool): If False, a failed run reports only the error message, skipping the
+                traceback formatting in the child and its transfer to the parent.
+            use_thread (bool): If True, runs the function in a thread of the current process instead of a child
+                process: no start-up, no pickling, for I/O-bound functions (HTTP, files, subprocesses). A thread
+                cannot be killed, so on timeout it is reported as still running and terminate() has no effect.
 
         Example:
         ----------
@@ -101,6 +131,19 @@ class ParallelRunner(Generic[T]):
         Parâmetros:
         ----------
             verbose (bool): Se True, exibe mensagens de depuração durante a execução.
+            result_in_shm (bool): Se True, um resultado bytes/bytearray é copiado para um bloco de memória
+                compartilhada em vez de ser serializado pelo pipe (apenas POSIX; ignorado nos demais).
+            reuse_process (bool): Se True, as execuções vão para um único processo trabalhador mantido entre as
+                chamadas de run(), pagando a inicialização do processo só uma vez (result_in_shm é ignorado).
+            start_method (str): método de início do multiprocessing ("fork", "forkserver" ou "spawn"); None usa
+                o padrão da plataforma. "fork" (apenas POSIX) inicia o filho sem um novo interpretador e sem
+                serializar a função e seus argumentos.
+            capture_traceback (bool): Se False, uma execução com falha informa apenas a mensagem de erro, sem
+                formatar o traceback no processo filho nem transferi-lo ao principal.
+            use_thread (bool): Se True, executa a função em uma thread do processo atual em vez de um processo
+                filho: sem inicialização nem serialização, para funções limitadas por I/O (HTTP, arquivos,
+                subprocessos). Uma thread não pode ser encerrada, então no timeout ela é informada como ainda em
+                execução e terminate() não tem efeito.
 
         Exemplo:
         ----------
@@ -114,11 +157,20 @@ class ParallelRunner(Generic[T]):
         5
         """
         try:
-            self._manager = Manager()
-            self._result_dict = self._manager.dict()
+            # The child sends a single result payload through a one-way pipe (no Manager server process)
+            self._conn = None
+            self._payload = None
             self._process = None
             self._start_time = None
             self.verbose = verbose
+            self.result_in_shm = result_in_shm and SHM_RESULTS_SUPPORTED
+            self.reuse_process = reuse_process
+            self._context = get_context(start_method)
+            self.capture_traceback = capture_traceback
+            self.use_thread = use_thread
+            self._thread = None
+            self._executor = None
+            self._future = None
 
             if self.verbose:
                 success_print("ParallelRunner initialized successfully")
@@ -127,19 +179,21 @@ class ParallelRunner(Generic[T]):
             raise ParallelRunnerError(f"Error initializing ParallelRunner: {str(e)}") from e
 
     @staticmethod
-    def _execute_function(function, args, kwargs, result_dict):
+    def _execute_function(  # pylint: disable=too-many-positional-arguments
+        function, args, kwargs, conn, verbose=False, result_in_shm=False, capture_traceback=True
+    ):
         """
-        Static method that executes the target function and stores the result.
+        Static method that executes the target function and sends the result.
 
-        This function is used internally to run the user function in a separate process and store its result or error in a shared dictionary.
+        This function is used internally to run the user function in a separate process and send its result or error to the parent process through a pipe, as a single message. With verbose, it also prints debug messages.
 
         Example:
         ----------
         (Internal use only)
 
-        Método estático que executa a função alvo e armazena o resultado.
+        Método estático que executa a função alvo e envia o resultado.
 
-        Esta função é usada internamente para executar a função do usuário em um processo separado e armazenar seu resultado ou erro em um dicionário compartilhado.
+        Esta função é usada internamente para executar a função do usuário em um processo separado e enviar seu resultado ou erro ao processo principal por um pipe, em uma única mensagem. Com verbose, também imprime mensagens de depuração.
 
         Exemplo:
         ----------
@@ -149,58 +203,118 @@ class ParallelRunner(Generic[T]):
             # Execute the user function with the provided arguments
             result = function(*args, **kwargs)
 
-            # Store the result in the shared dictionary
-            result_dict["status"] = "success"
-            result_dict["result"] = result
+            # For debug
+            if verbose:
+                success_print(f"[Child Process] Result calculated: {result}")
+
+            # Send the result to the parent process
+            ParallelRunner._send_result(conn, result, result_in_shm)
 
         except Exception as e:
-            # In case of error, store information about the error
-            result_dict["status"] = "error"
-            result_dict["error"] = str(e)
-            result_dict["traceback"] = traceback.format_exc()
+            # In case of error, send information about the error
+            ParallelRunner._send_message(conn, ParallelRunner._error_payload(e, capture_traceback))
 
             # For debug
             error_print(f"[Child Process] Error occurred: {str(e)}")
 
+        finally:
+            conn.close()
+
     @staticmethod
-    def _execute_function_w_disp_msg(function, args, kwargs, result_dict):
+    def _error_payload(error, capture_traceback):
+        """
+        Builds the error message sent to the parent, with the formatted traceback only if requested (internal use).
         """
-        Static method that executes the target function and stores the result, displaying debug messages.
+        payload = {"status": "error", "error": str(error)}
+        if capture_traceback:
+            payload["traceback"] = traceback.format_exc()
+        return payload
 
-        This function is used internally to run the user function in a separate process, store its result or error in a shared dictionary, and print debug messages.
+    @staticmethod
+    def _send_result(conn, result, result_in_shm):
+        """
+        Sends a success message with the result, through shared memory for bytes-like results if enabled (internal use).
+        """
+        if result_in_shm and isinstance(result, (bytes, bytearray)) and result:
+            shm = shared_memory.SharedMemory(create=True, size=len(result))
+            try:
+                shm.buf[: len(result)] = result
+            finally:
+                shm.close()
+            # Only the block name travels through the pipe; the parent copies the data out and unlinks it
+            ParallelRunner._send_message(
+                conn,
+                {"status": "success", "shm_name": shm.name, "shm_size": len(result), "shm_type": type(result).__name__},
+            )
+        else:
+            ParallelRunner._send_message(conn, {"status": "success", "result": result})
 
-        Example:
-        ----------
-        (Internal use only)
+    @staticmethod
+    def _send_message(conn, message):
+        """
+        Sends a message pickled with protocol 5, large buffers (bytearray, numpy arrays) out-of-band (internal use).
 
-        Método estático que executa a função alvo e armazena o resultado, exibindo mensagens de depuração.
+        Buffers that support it are written to the pipe straight from the object's memory instead of being
+        copied into the pickle stream first.
+        """
+        buffers = []
+        data = pickle.dumps(message, protocol=5, buffer_callback=buffers.append)
+        conn.send(len(buffers))
+        conn.send_bytes(data)
+        for buffer in buffers:
+            conn.send_bytes(buffer.raw())
 
-        Esta função é usada internamente para executar a função do usuário em um processo separado, armazenar seu resultado ou erro em um dicionário compartilhado e imprimir mensagens de depuração.
+    @staticmethod
+    def _recv_message(conn):
+        """
+        Receives a message sent by ``_send_message`` (internal use).
+        """
+        buffer_count = conn.recv()
+        data = conn.recv_bytes()
+        buffers = [conn.recv_bytes() for _ in range(buffer_count)]
+        return pickle.loads(data, buffers=buffers)
 
-        Exemplo:
-        ----------
-        (Uso interno apenas)
+    @staticmethod
+    def _read_shm_result(payload):
         """
+        Replaces the shared memory reference of a received payload by the result it holds (internal use).
+        """
+        shm = shared_memory.SharedMemory(name=payload.pop("shm_name"))
         try:
-            # Execute the user function with the provided arguments
-            result = function(*args, **kwargs)
-
-            # Store the result in the shared dictionary
-            result_dict["status"] = "success"
-            result_dict["result"] = result
-
-            # For debug
-            success_print(f"[Child Process] Result calculated: {result}")
-            success_print(f"[Child Process] Result dictionary: {dict(result_dict)}")
+            data = shm.buf[: payload.pop("shm_size")]
+            result = bytearray(data) if payload.pop("shm_type") == "bytearray" else bytes(data)
+            data.release()
+        finally:
+            shm.close()
+            shm.unlink()
+        payload["result"] = result
 
+    @staticmethod
+    def _execute_pooled(function, args, kwargs, verbose, capture_traceback=True):
+        """
+        Runs the target function in the reused worker process and returns the result message (internal use).
+        """
+        try:
+            result = function(*args, **kwargs)
+            if verbose:
+                success_print(f"[Child Process] Result calculated: {result}")
+            return {"status": "success", "result": result}
         except Exception as e:
-            # In case of error, store information about the error
-            result_dict["status"] = "error"
-            result_dict["error"] = str(e)
-            result_dict["traceback"] = traceback.format_exc()
-
-            # For debug
             error_print(f"[Child Process] Error occurred: {str(e)}")
+            return ParallelRunner._error_payload(e, capture_traceback)
+
+    def _execute_in_thread(self, function, args, kwargs):
+        """
+        Runs the target function in the runner thread and keeps the result message on the instance (internal use).
+        """
+        try:
+            result = function(*args, **kwargs)
+            if self.verbose:
+                success_print(f"[Thread] Result calculated: {result}")
+            self._payload = {"status": "success", "result": result}
+        except Exception as e:
+            error_print(f"[Thread] Error occurred: {str(e)}")
+            self._payload = ParallelRunner._error_payload(e, self.capture_traceback)
 
     def run(self, function: Callable[..., T], *args, **kwargs) -> "ParallelRunner[T]":
         """
@@ -250,28 +364,56 @@ class ParallelRunner(Generic[T]):
         """
         try:
             # Clear previous result, if any
-            if self._result_dict:
-                self._result_dict.clear()
+            self._close_conn()
+            self._payload = None
+            self._future = None
+            self._thread = None
+
+            if self.use_thread:
+                self._process = None
+                self._thread = threading.Thread(
+                    target=self._execute_in_thread, args=(function, args, kwargs), daemon=True
+                )
+                self._start_time = time.time()
+                self._thread.start()
+                if self.verbose:
+                    success_print("Parallel thread started successfully")
+                return self
+
+            if self.reuse_process:
+                # Single worker created on the first run and kept for the next ones
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=1, mp_context=self._context)
+                self._process = None
+                self._future = self._executor.submit(
+                    ParallelRunner._execute_pooled, function, args, kwargs, self.verbose, self.capture_traceback
+                )
+                self._start_time = time.time()
+                if self.verbose:
+                    success_print("Parallel task submitted to the reused process")
+                return self
+
+            # One-way pipe: the child writes one result message, the parent reads it in get_result
+            self._conn, child_conn = self._context.Pipe(duplex=False)
 
-            # Configure initial values in the shared dictionary
-            self._result_dict["status"] = "running"
+            if self.result_in_shm:
+                # Start the resource tracker here, so a forked child shares it instead of starting its own,
+                # which would unlink the result block as soon as the child exits
+                resource_tracker.ensure_running()
 
             # Start the process with the static helper function
-            if self.verbose:
-                self._process = Process(
-                    target=ParallelRunner._execute_function_w_disp_msg,
-                    args=(function, args, kwargs, self._result_dict),
-                )
-            else:
-                self._process = Process(
-                    target=ParallelRunner._execute_function,
-                    args=(function, args, kwargs, self._result_dict),
-                )
+            self._process = self._context.Process(
+                target=ParallelRunner._execute_function,
+                args=(function, args, kwargs, child_conn, self.verbose, self.result_in_shm, self.capture_traceback),
+            )
 
             self._process.daemon = True  # Child process terminates when main terminates
             self._process.start()
             self._start_time = time.time()
 
+            # Only the child keeps the write end, so a child that dies without sending shows up as EOF
+            child_conn.close()
+
             if self.verbose:
                 success_print("Parallel process started successfully")
 
@@ -280,6 +422,23 @@ class ParallelRunner(Generic[T]):
         except Exception as e:
             raise ParallelRunnerError(f"Error starting parallel process: {str(e)}") from e
 
+    @property
+    def sentinel(self) -> Any:
+        """
+        Object that becomes ready when the result can be read without blocking, for ``wait_any``.
+
+        It is the result pipe while the result has not been read (so a child blocked sending a large result
+        is still reported as ready), the process sentinel afterwards, and None when nothing can be waited on
+        (no run started, or a run submitted to the reused worker process).
+
+        Objeto que fica pronto quando o resultado pode ser lido sem bloquear, para ``wait_any``.
+        """
+        if self._conn is not None:
+            return self._conn
+        if self._process is not None:
+            return self._process.sentinel
+        return None
+
     def is_running(self) -> bool:
         """
         Checks if the parallel process is still running.
@@ -305,6 +464,10 @@ class ParallelRunner(Generic[T]):
         True
         """
         try:
+            if self._thread is not None:
+                return self._thread.is_alive()
+            if self._future is not None:
+                return not self._future.done()
             if self._process is None:
                 return False
             return self._process.is_alive()
@@ -332,7 +495,7 @@ class ParallelRunner(Generic[T]):
                 * 'success': bool - True if the operation was successful.
                 * 'result': result of the function (if successful).
                 * 'error': error message (if any).
-                * 'traceback': full stack trace (if an error occurred).
+                * 'traceback': full stack trace (if an error occurred and capture_traceback is enabled).
                 * 'execution_time': execution time in seconds.
                 * 'terminated': True if the process was terminated due to timeout.
 
@@ -356,7 +519,7 @@ class ParallelRunner(Generic[T]):
                 * 'success': bool - True se a operação foi bem-sucedida.
                 * 'result': resultado da função (se bem-sucedida).
                 * 'error': mensagem de erro (se houver).
-                * 'traceback': stack trace completo (se ocorreu erro).
+                * 'traceback': stack trace completo (se ocorreu erro e capture_traceback está ativo).
                 * 'execution_time': tempo de execução em segundos.
                 * 'terminated': True se o processo foi encerrado por timeout.
 
@@ -366,6 +529,11 @@ class ParallelRunner(Generic[T]):
         >>> print(resultado['success'], resultado.get('result'))
         """
         try:
+            if self._thread is not None:
+                return self._get_thread_result(timeout)
+            if self._future is not None:
+                return self._get_pooled_result(timeout, terminate_on_timeout)
+
             if self._process is None:
                 return {
                     "success": False,
@@ -374,26 +542,41 @@ class ParallelRunner(Generic[T]):
                     "terminated": False,
                 }
 
-            # Wait for the process to finish with timeout
-            self._process.join(timeout=timeout)
+            # Wait for the result message (or EOF) with timeout; reading it before join() keeps a child
+            # sending a large result from blocking on a full pipe
+            if self._payload is None and self._conn is not None and self._conn.poll(timeout):
+                try:
+                    self._payload = self._recv_message(self._conn)
+                    if "shm_name" in self._payload:
+                        self._read_shm_result(self._payload)
+                except EOFError:
+                    # The child exited without sending anything
+                    self._payload = {}
+                self._close_conn()
+            elif self._payload is None and self._conn is None:
+                self._process.join(timeout=timeout)
+            if self._payload is not None:
+                # The run is over once its result arrived; the child only has to exit
+                self._process.join(timeout=1)
+            finished = self._payload is not None or not self._process.is_alive()
             execution_time = time.time() - self._start_time
 
             # Prepare the response dictionary
             result = {"execution_time": execution_time, "terminated": False}
+            payload = self._payload or {}
 
-            # Debug - show the shared dictionary
+            # Debug - show the received payload
             if self.verbose:
-                success_print(f"[Main Process] Shared dictionary: {dict(self._result_dict)}")
+                success_print(f"[Main Process] Received payload: {payload}")
 
             # Check if the process finished or reached timeout
-            if self._process.is_alive():
+            if not finished:
                 if terminate_on_timeout:
                     try:
-                        self._process.terminate()
-                        self._process.join(timeout=1)  # Small timeout to ensure process terminates
+                        self._stop_process()
                         result["terminated"] = True
                         result["success"] = False
-                        result["error"] = "Operation cancelled due to timeout after {execution_time:.2f} seconds"
+                        result["error"] = f"Operation cancelled due to timeout after {execution_time:.2f} seconds"
 
                         if self.verbose:
                             alert_print("Process terminated due to timeout")
@@ -409,36 +592,36 @@ class ParallelRunner(Generic[T]):
             else:
                 # Process finished normally - check the status
                 try:
-                    status = self._result_dict.get("status", "unknown")
+                    status = payload.get("status", "unknown")
 
                     if status == "success":
                         result["success"] = True
                         # Ensure the result is being copied correctly
-                        if "result" in self._result_dict:
-                            result["result"] = self._result_dict["result"]
+                        if "result" in payload:
+                            result["result"] = payload["result"]
                             if self.verbose:
                                 success_print("Result retrieved successfully")
                         else:
                             result["success"] = False
-                            result["error"] = "Result not found in shared dictionary"
+                            result["error"] = "Result not found in received payload"
                             if self.verbose:
-                                error_print("Result not found in shared dictionary")
+                                error_print("Result not found in received payload")
                     else:
                         result["success"] = False
-                        result["error"] = self._result_dict.get("error", "Unknown error")
-                        if "traceback" in self._result_dict:
-                            result["traceback"] = self._result_dict["traceback"]
+                        result["error"] = payload.get("error", "Unknown error")
+                        if "traceback" in payload:
+                            result["traceback"] = payload["traceback"]
                         if self.verbose:
                             error_print(f"Process failed with error: {result['error']}")
 
                 except Exception as e:
                     result["success"] = False
-                    result["error"] = f"Error retrieving result from shared dictionary: {str(e)}"
+                    result["error"] = f"Error retrieving result from parallel process: {str(e)}"
                     if self.verbose:
                         error_print(f"Error retrieving result: {str(e)}")
 
-            # Finalize the Manager if the process finished and we're no longer waiting for result
-            if not self._process.is_alive() and (result.get("success", False) or result.get("terminated", False)):
+            # Release the process and pipe if it finished and we're no longer waiting for result
+            if finished and (result.get("success", False) or result.get("terminated", False)):
                 self._cleanup()
 
             return result
@@ -454,6 +637,83 @@ class ParallelRunner(Generic[T]):
                 "terminated": False,
             }
 
+    def _get_pooled_result(self, timeout: Optional[float], terminate_on_timeout: bool) -> Dict[str, Any]:
+        """
+        get_result() for runs submitted to the reused worker process (internal use).
+        """
+        try:
+            payload = self._future.result(timeout=timeout)
+        except FutureTimeoutError:
+            execution_time = time.time() - self._start_time
+            result = {"execution_time": execution_time, "terminated": False, "success": False}
+            if terminate_on_timeout:
+                self._shutdown_executor(kill=True)
+                self._future = None
+                result["terminated"] = True
+                result["error"] = f"Operation cancelled due to timeout after {execution_time:.2f} seconds"
+                if self.verbose:
+                    alert_print("Process terminated due to timeout")
+            else:
+                result["error"] = f"Operation still running after {execution_time:.2f} seconds"
+            return result
+        except Exception as e:  # the worker died (BrokenProcessPool); a new one is created on the next run
+            self._shutdown_executor(kill=True)
+            payload = {"status": "error", "error": str(e) or "Unknown error"}
+
+        return self._result_from_payload(payload)
+
+    def _get_thread_result(self, timeout: Optional[float]) -> Dict[str, Any]:
+        """
+        get_result() for runs started with use_thread (internal use).
+        """
+        self._thread.join(timeout=timeout)
+        if self._thread.is_alive():
+            execution_time = time.time() - self._start_time
+            if self.verbose:
+                alert_print("Thread still running after timeout (threads cannot be terminated)")
+            return {
+                "execution_time": execution_time,
+                "terminated": False,
+                "success": False,
+                "error": f"Operation still running after {execution_time:.2f} seconds",
+            }
+        return self._result_from_payload(self._payload or {})
+
+    def _result_from_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Builds the get_result() dictionary from a finished run's result message (internal use).
+        """
+        result = {"execution_time": time.time() - self._start_time, "terminated": False}
+        if payload.get("status") == "success":
+            result["success"] = True
+            result["result"] = payload["result"]
+            if self.verbose:
+                success_print("Result retrieved successfully")
+        else:
+            result["success"] = False
+            result["error"] = payload.get("error", "Unknown error")
+            if "traceback" in payload:
+                result["traceback"] = payload["traceback"]
+            if self.verbose:
+                error_print(f"Process failed with error: {result['error']}")
+        return result
+
+    def _shutdown_executor(self, kill: bool = False) -> None:
+        """
+        Shuts the reused worker process down, terminating it first when ``kill`` is True (internal use).
+        """
+        executor, self._executor = getattr(self, "_executor", None), None
+        if executor is None:
+            return
+        if kill:
+            terminate_workers = getattr(executor, "terminate_workers", None)  # Python 3.14+
+            if terminate_workers is not None:
+                terminate_workers()
+            else:
+                for process in list((getattr(executor, "_processes", None) or {}).values()):
+                    process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
     def terminate(self) -> None:
         """
         Terminates the running parallel process, if any.
@@ -473,9 +733,18 @@ class ParallelRunner(Generic[T]):
         >>> runner.terminate()
         """
         try:
+            if self._thread is not None and self._thread.is_alive() and self.verbose:
+                alert_print("A running thread cannot be terminated")
+
+            if self._future is not None and not self._future.done():
+                self._shutdown_executor(kill=True)
+                self._future = None
+
+                if self.verbose:
+                    success_print("Process terminated successfully")
+
             if self._process and self._process.is_alive():
-                self._process.terminate()
-                self._process.join(timeout=1)
+                self._stop_process()
                 self._cleanup()
 
                 if self.verbose:
@@ -485,6 +754,16 @@ class ParallelRunner(Generic[T]):
             if self.verbose:
                 error_print(f"Error terminating process: {str(e)}")
 
+    def _stop_process(self) -> None:
+        """
+        Stops the child process: SIGTERM first, SIGKILL if it is still alive 50 ms later (internal use).
+        """
+        self._process.terminate()
+        self._process.join(timeout=0.05)
+        if self._process.is_alive():
+            self._process.kill()
+            self._process.join()
+
     def _cleanup(self) -> None:
         """
         Cleans up resources used by the process.
@@ -504,14 +783,13 @@ class ParallelRunner(Generic[T]):
         (Uso interno apenas)
         """
         try:
-            if hasattr(self, "_manager") and self._manager is not None:
-                try:
-                    self._manager.shutdown()
-                except Exception as e:
-                    if self.verbose:
-                        error_print(f"Error shutting down manager: {str(e)}")
-                self._manager = None
-            self._process = None
+            # Idempotent: a second call finds nothing left to release and returns quietly
+            if self._conn is None and self._process is None:
+                return
+            self._close_conn()
+            process, self._process = self._process, None
+            if process is not None and not process.is_alive():
+                process.close()  # releases the sentinel handle now instead of at garbage collection
 
             if self.verbose:
                 success_print("Resources cleaned up successfully")
@@ -520,6 +798,17 @@ class ParallelRunner(Generic[T]):
             if self.verbose:
                 error_print(f"Error during cleanup: {str(e)}")
 
+    def _close_conn(self) -> None:
+        """Closes the parent end of the result pipe, if open (internal use)."""
+        conn = getattr(self, "_conn", None)
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception as e:
+                if self.verbose:
+                    error_print(f"Error closing result pipe: {str(e)}")
+            self._conn = None
+
     def __del__(self):
         """
         Destructor of the class, ensures resources are released.
@@ -540,6 +829,223 @@ class ParallelRunner(Generic[T]):
         """
         try:
             self.terminate()
+            self._shutdown_executor()
         except Exception:
             # Silently handle any errors during destruction
             pass
+
+
+class BatchParallelRunner:
+    """
+    Runs many tasks, one after another, in a single long-lived child process.
+
+    Tasks are sent to the child through a queue and their results come back through another one, so the
+    process start-up is paid once for all tasks instead of once per task as with ``ParallelRunner``.
+
+    Example:
+    ----------
+    >>> with BatchParallelRunner() as batch:
+    ...     ids = [batch.submit(slow_add, i, 1) for i in range(3)]
+    ...     results = [batch.get_next_result(timeout=10) for _ in ids]
+    >>> sorted(r['result'] for r in results)
+    [1, 2, 3]
+
+    Executa muitas tarefas, uma após a outra, em um único processo filho de longa duração.
+
+    As tarefas são enviadas ao processo filho por uma fila e os resultados voltam por outra, então a
+    inicialização do processo é paga uma única vez para todas as tarefas, em vez de uma vez por tarefa como no
+    ``ParallelRunner``.
+    """
+
+    def __init__(self, verbose: bool = False, start_method: Optional[str] = None, capture_traceback: bool = True):
+        """
+        Creates the task/result queues and starts the worker process.
+
+        Parameters:
+        ----------
+            verbose (bool): If True, displays debug messages.
+            start_method (str): multiprocessing start method ("fork", "forkserver" or "spawn"); None uses the
+                platform default.
+            capture_traceback (bool): If False, failed tasks report only the error message.
+
+        Parâmetros:
+        ----------
+            verbose (bool): Se True, exibe mensagens de depuração.
+            start_method (str): método de início do multiprocessing ("fork", "forkserver" ou "spawn"); None
+                usa o padrão da plataforma.
+            capture_traceback (bool): Se False, tarefas com falha informam apenas a mensagem de erro.
+        """
+        try:
+            self.verbose = verbose
+            context = get_context(start_method)
+            self._tasks = context.Queue()
+            self._results = context.Queue()
+            self._next_id = 0
+            self._process = context.Process(
+                target=BatchParallelRunner._worker, args=(self._tasks, self._results, capture_traceback)
+            )
+            self._process.daemon = True  # Child process terminates when main terminates
+            self._process.start()
+
+            if self.verbose:
+                success_print("BatchParallelRunner worker started successfully")
+
+        except Exception as e:
+            raise ParallelRunnerError(f"Error initializing BatchParallelRunner: {str(e)}") from e
+
+    @staticmethod
+    def _worker(tasks, results, capture_traceback):
+        """
+        Worker loop: runs tasks until it receives None (internal use).
+        """
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            task_id, function, args, kwargs = task
+            start_time = time.time()
+            try:
+                payload = {"status": "success", "result": function(*args, **kwargs)}
+            except Exception as e:
+                error_print(f"[Child Process] Error occurred: {str(e)}")
+                payload = ParallelRunner._error_payload(e, capture_traceback)
+            payload["execution_time"] = time.time() - start_time
+            try:
+                # Pickled here, so an unpicklable result is reported instead of being lost in the queue thread
+                data = pickle.dumps(payload, protocol=5)
+            except Exception as e:
+                payload = ParallelRunner._error_payload(e, capture_traceback)
+                payload["execution_time"] = time.time() - start_time
+                data = pickle.dumps(payload, protocol=5)
+            results.put((task_id, data))
+
+    def submit(self, function: Callable[..., Any], *args, **kwargs) -> int:
+        """
+        Queues a task for the worker process and returns its task id.
+
+        Enfileira uma tarefa para o processo trabalhador e retorna o id da tarefa.
+        """
+        try:
+            task_id = self._next_id
+            self._next_id += 1
+            self._tasks.put((task_id, function, args, kwargs))
+            return task_id
+        except Exception as e:
+            raise ParallelRunnerError(f"Error submitting task: {str(e)}") from e
+
+    def get_next_result(self, timeout: Optional[float] = 60) -> Dict[str, Any]:
+        """
+        Returns the result of the next finished task, waiting up to ``timeout`` seconds.
+
+        Returns:
+        ----------
+            dict: Same keys as ``ParallelRunner.get_result()`` ('success', 'result' or 'error'/'traceback',
+                'execution_time', 'terminated') plus 'task_id' (None if no result arrived in time).
+
+        Retorna o resultado da próxima tarefa concluída, aguardando até ``timeout`` segundos.
+        """
+        try:
+            task_id, data = self._results.get(timeout=timeout)
+        except queue.Empty:
+            if self._process.is_alive():
+                error = f"No task finished within {timeout} seconds"
+            else:
+                error = "Worker process is not running"
+            if self.verbose:
+                alert_print(error)
+            return {"task_id": None, "success": False, "error": error, "execution_time": 0, "terminated": False}
+
+        payload = pickle.loads(data)
+        result = {"task_id": task_id, "execution_time": payload["execution_time"], "terminated": False}
+        if payload["status"] == "success":
+            result["success"] = True
+            result["result"] = payload["result"]
+        else:
+            result["success"] = False
+            result["error"] = payload.get("error", "Unknown error")
+            if "traceback" in payload:
+                result["traceback"] = payload["traceback"]
+            if self.verbose:
+                error_print(f"Task {task_id} failed with error: {result['error']}")
+        return result
+
+    def close(self, timeout: float = 5) -> None:
+        """
+        Asks the worker to exit after the queued tasks, killing it if it is still alive after ``timeout`` seconds.
+
+        Pede ao processo trabalhador para sair após as tarefas enfileiradas, encerrando-o se ainda estiver vivo
+        após ``timeout`` segundos.
+        """
+        process = getattr(self, "_process", None)
+        if process is None:
+            return
+        self._process = None
+        try:
+            if process.is_alive():
+                self._tasks.put(None)
+                process.join(timeout=timeout)
+                if process.is_alive():
+                    process.kill()
+                    process.join()
+            process.close()
+            self._tasks.close()
+            self._results.close()
+
+            if self.verbose:
+                success_print("BatchParallelRunner closed successfully")
+
+        except Exception as e:
+            if self.verbose:
+                error_print(f"Error closing BatchParallelRunner: {str(e)}")
+
+    def __enter__(self) -> "BatchParallelRunner":
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close(timeout=1)
+        except Exception:
+            # Silently handle any errors during destruction
+            pass
+
+
+def wait_any(runners: Iterable[ParallelRunner], timeout: Optional[float] = None) -> List[ParallelRunner]:
+    """
+    Waits until at least one of the runners has its result ready, up to ``timeout`` seconds.
+
+    All runners are waited on with a single ``multiprocessing.connection.wait`` call (select/poll on POSIX,
+    WaitForMultipleObjects on Windows) instead of joining them one by one. Runners without a sentinel
+    (see ``ParallelRunner.sentinel``) are ignored.
+
+    Parameters:
+    ----------
+        runners: Runners started with ``run()``.
+        timeout: Maximum time (in seconds) to wait. None means wait indefinitely.
+
+    Returns:
+    ----------
+        list: The runners whose ``get_result()`` will not block (empty if the timeout was reached).
+
+    Example:
+    ----------
+    >>> runners = [ParallelRunner().run(slow_add, i, 1) for i in range(10)]
+    >>> for runner in wait_any(runners, timeout=5):
+    ...     print(runner.get_result()["result"])
+
+    Aguarda até que ao menos um dos runners tenha o resultado pronto, por até ``timeout`` segundos.
+
+    Retorno:
+    ----------
+        list: Os runners cujo ``get_result()`` não vai bloquear (vazia se o tempo limite foi atingido).
+    """
+    by_sentinel = {}
+    for runner in runners:
+        sentinel = runner.sentinel
+        if sentinel is not None:
+            by_sentinel[sentinel] = runner
+    if not by_sentinel:
+        return []
+    return [by_sentinel[ready] for ready in connection.wait(list(by_sentinel), timeout)]
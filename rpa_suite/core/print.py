@@ -1,7 +1,7 @@
 # rpa_suite/core/print.py
 
-# imports third party
-from colorama import Fore
+# imports internal
+from rpa_suite.functions._printer import _RESET, Colors
 
 
 class PrintError(Exception):
@@ -11,23 +11,6 @@ class PrintError(Exception):
         super().__init__(f"Print Error: {message}")
 
 
-# Windows bash colors
-class Colors:
-    """Color constants for console output formatting."""
-
-    black = f"{Fore.BLACK}"
-    blue = f"{Fore.BLUE}"
-    green = f"{Fore.GREEN}"
-    cyan = f"{Fore.CYAN}"
-    red = f"{Fore.RED}"
-    magenta = f"{Fore.MAGENTA}"
-    yellow = f"{Fore.YELLOW}"
-    white = f"{Fore.WHITE}"
-    default = f"{Fore.WHITE}"
-    call_fn = f"{Fore.LIGHTMAGENTA_EX}"
-    retur_fn = f"{Fore.LIGHTYELLOW_EX}"
-
-
 class Print:
     """
     Class that provides methods for formatted printing in the console, allowing for different types of messages to be displayed with specific colors.
@@ -71,7 +54,7 @@ class Print:
         --------
         None
         """
-        print(f"{color}{string_text}{Colors.default}", end=ending)
+        print(f"{color}{string_text}{_RESET}", end=ending)
 
     def alert_print(self, string_text: str, color=Colors.yellow, ending="\n") -> None:
         """
@@ -92,7 +75,7 @@ class Print:
         --------
         None
         """
-        print(f"{color}{string_text}{Colors.default}", end=ending)
+        print(f"{color}{string_text}{_RESET}", end=ending)
 
     def info_print(self, string_text: str, color=Colors.cyan, ending="\n") -> None:
         """
@@ -113,7 +96,7 @@ class Print:
         --------
         None
         """
-        print(f"{color}{string_text}{Colors.default}", end=ending)
+        print(f"{color}{string_text}{_RESET}", end=ending)
 
     def error_print(self, string_text: str, color=Colors.red, ending="\n") -> None:
         """
@@ -134,7 +117,7 @@ class Print:
         --------
         None
         """
-        print(f"{color}{string_text}{Colors.default}", end=ending)
+        print(f"{color}{string_text}{_RESET}", end=ending)
 
     def magenta_print(self, string_text: str, color=Colors.magenta, ending="\n") -> None:
         """
@@ -155,7 +138,7 @@ class Print:
         --------
         None
         """
-        print(f"{color}{string_text}{Colors.default}", end=ending)
+        print(f"{color}{string_text}{_RESET}", end=ending)
 
     def blue_print(self, string_text: str, color=Colors.blue, ending="\n") -> None:
         """
@@ -176,7 +159,7 @@ class Print:
         --------
         None
         """
-        print(f"{color}{string_text}{Colors.default}", end=ending)
+        print(f"{color}{string_text}{_RESET}", end=ending)
 
     def print_call_fn(self, string_text: str, color=Colors.call_fn, ending="\n") -> None:
         """
@@ -198,7 +181,7 @@ class Print:
         --------
         None
         """
-        print(f"{color}{string_text}{Colors.default}", end=ending)
+        print(f"{color}{string_text}{_RESET}", end=ending)
 
     def print_retur_fn(self, string_text: str, color=Colors.retur_fn, ending="\n") -> None:
         """
@@ -220,4 +203,4 @@ class Print:
         --------
         None
         """
-        print(f"{color}{string_text}{Colors.default}", end=ending)
+        print(f"{color}{string_text}{_RESET}", end=ending)
@@ -1,7 +1,25 @@
 # rpa_suite/core/regex.py
 
 # imports standard
+import functools
 import re
+import threading
+from typing import Callable
+
+# imports third party
+try:
+    import hyperscan
+
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import re2
+
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
 
 # imports internal
 from rpa_suite.functions._printer import success_print
@@ -15,6 +33,98 @@ class RegexError(Exception):
         super().__init__(f"RegexError: {clean_message}")
 
 
+# Characters with a special meaning in a pattern; a pattern without any of them matches literally
+_RE_META = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_literal(pattern: str) -> bool:
+    """True when the pattern has no regex metacharacter, so a plain substring test gives the same answer."""
+    return _RE_META.search(pattern) is None
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(pattern: str, case_sensitive: bool) -> re.Pattern:
+    """Compiles a pattern once per (pattern, case_sensitive) pair."""
+    return re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+
+
+def _hyperscan_matcher(patterns: tuple[str, ...], case_sensitive: bool) -> Callable[[str], list[bool]]:
+    """Compiles all patterns into one Hyperscan database, scanned once per text."""
+    flags = hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    if not case_sensitive:
+        flags |= hyperscan.HS_FLAG_CASELESS
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[pattern.encode("utf-8") for pattern in patterns],
+        ids=list(range(len(patterns))),
+        elements=len(patterns),
+        flags=[flags] * len(patterns),
+    )
+    lock = threading.Lock()  # a database has a single scratch space, so scans must not overlap
+
+    def match(text: str) -> list[bool]:
+        found = [False] * len(patterns)
+
+        def on_match(pattern_id, _start, _end, _flags, _context):
+            found[pattern_id] = True
+
+        with lock:
+            database.scan(text.encode("utf-8"), match_event_handler=on_match)
+        return found
+
+    return match
+
+
+def _re2_matcher(patterns: tuple[str, ...], case_sensitive: bool) -> Callable[[str], list[bool]]:
+    """Compiles all patterns into one RE2 set, searched once per text."""
+    options = re2.Options()
+    options.case_sensitive = case_sensitive
+    options.log_errors = False  # unsupported patterns raise re2.error (and fall back), no stderr noise
+    pattern_set = re2.Set.SearchSet(options)
+    for pattern in patterns:
+        pattern_set.Add(pattern)
+    pattern_set.Compile()
+
+    def match(text: str) -> list[bool]:
+        found = [False] * len(patterns)
+        for pattern_id in pattern_set.Match(text):
+            found[pattern_id] = True
+        return found
+
+    return match
+
+
+def _re_matcher(patterns: tuple[str, ...], case_sensitive: bool) -> Callable[[str], list[bool]]:
+    """Searches each pattern with Python's re (same semantics as check_pattern_in_text)."""
+    compiled = [_compile(pattern, case_sensitive) for pattern in patterns]
+    return lambda text: [pattern.search(text) is not None for pattern in compiled]
+
+
+@functools.lru_cache(maxsize=64)
+def _bulk_matcher(patterns: tuple[str, ...], case_sensitive: bool, engine: str) -> Callable[[str], list[bool]]:
+    """
+    Returns a text -> [found per pattern] function, built once per pattern list.
+
+    With engine="auto", Hyperscan is tried first, then RE2, and Python's re last; a pattern
+    list that an engine cannot compile (unsupported syntax) falls through to the next one.
+    """
+    builders = {"hyperscan": _hyperscan_matcher, "re2": _re2_matcher, "re": _re_matcher}
+    if engine != "auto":
+        return builders[engine](patterns, case_sensitive)
+    if HYPERSCAN_AVAILABLE and patterns:
+        try:
+            return _hyperscan_matcher(patterns, case_sensitive)
+        except hyperscan.error:
+            pass
+    if RE2_AVAILABLE and patterns:
+        try:
+            return _re2_matcher(patterns, case_sensitive)
+        except re2.error:
+            pass
+    return _re_matcher(patterns, case_sensitive)
+
+
 class Regex:
     """
     Class that provides utilities for working with regular expressions.
@@ -78,24 +188,79 @@ class Regex:
         True
         """
         try:
-            if case_sensitive:
-                if re.search(pattern_to_search, origin_text):
-                    if verbose:
-                        success_print("Pattern found successfully!")
-                    return True
-                if verbose:
-                    success_print("Pattern not found.")
-                return False
-            # Busca sem diferenciar maiúsculas/minúsculas
-            if re.search(pattern_to_search, origin_text, re.IGNORECASE):
-                if verbose:
-                    success_print("Pattern found successfully!")
-                return True
+            if _is_literal(pattern_to_search) and (
+                case_sensitive or (pattern_to_search.isascii() and origin_text.isascii())
+            ):
+                # Literal pattern: C-level substring search (ASCII only when ignoring case, where lower() and
+                # re.IGNORECASE agree)
+                if case_sensitive:
+                    found = pattern_to_search in origin_text
+                else:
+                    found = pattern_to_search.lower() in origin_text.lower()
+            else:
+                found = _compile(pattern_to_search, case_sensitive).search(origin_text) is not None
             if verbose:
-                success_print("Pattern not found.")
-            return False
+                success_print("Pattern found successfully!" if found else "Pattern not found.")
+            return found
 
         except Exception as e:
             raise RegexError(
                 f"Error in function: {self.check_pattern_in_text.__name__} when trying to check pattern in text. Error: {str(e)}"
             ) from e
+
+    def check_patterns_in_texts(
+        self,
+        texts: list[str],
+        patterns: list[str],
+        case_sensitive: bool = True,
+        engine: str = "auto",
+        verbose: bool = False,
+    ) -> list[list[bool]]:
+        """
+        Checks many regex patterns against many texts at once, returning one row of booleans per text.
+
+        All patterns are compiled together once and each text is scanned a single time. Hyperscan
+        (``hyperscan``) or RE2 (``google-re2``) are used when installed, falling back to Python's ``re``.
+
+        Parameters:
+        -----------
+        texts : list[str]
+            The texts where the search will be performed.
+
+        patterns : list[str]
+            The regex patterns to search for in each text.
+
+        case_sensitive : bool, optional
+            If True, the search is case sensitive. Default: True.
+
+        engine : str, optional
+            "auto", "hyperscan", "re2" or "re". Hyperscan and RE2 do not support every ``re`` feature
+            (backreferences, lookarounds) and RE2 matches ``\\d``/``\\w`` as ASCII only; "auto" falls back
+            to ``re`` when a pattern cannot be compiled, use "re" to get exactly the ``re`` semantics. Default: "auto".
+
+        verbose : bool, optional
+            If True, prints how many texts matched at least one pattern. Default: False.
+
+        Returns:
+        --------
+        list[list[bool]]
+            ``result[i][j]`` is True if ``patterns[j]`` is found in ``texts[i]``.
+
+        Example:
+        --------
+        >>> from rpa_suite.core.regex import Regex
+        >>> r = Regex()
+        >>> r.check_patterns_in_texts(["Hello World", "Invoice 123"], ["World", r"\\d+"])
+        [[True, False], [False, True]]
+        """
+        try:
+            match = _bulk_matcher(tuple(patterns), case_sensitive, engine)
+            results = [match(text) for text in texts]
+            if verbose:
+                success_print(f"Patterns found in {sum(any(row) for row in results)} of {len(results)} texts.")
+            return results
+
+        except Exception as e:
+            raise RegexError(
+                f"Error in function: {self.check_patterns_in_texts.__name__} when trying to check patterns in texts. Error: {str(e)}"
+            ) from e
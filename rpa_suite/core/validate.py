@@ -1,11 +1,86 @@
 # rpa_suite/core/mail_validator.py
 
+# imports standard
+import functools
+import re
+from collections import Counter
+
 # imports third party
 import email_validator
 
 # imports internal
 from rpa_suite.functions._printer import success_print
 
+# Necessary (not sufficient) shape of an address accepted by email_validator: one "@", no whitespace and a dot in
+# the domain. Anything failing it is rejected without paying for the full parse and the exception it raises.
+_EMAIL_PREFILTER = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+@functools.lru_cache(maxsize=None)
+def _dns_resolver():
+    """Shared caching resolver, so each domain's MX/A lookup is done once per process (internal use)."""
+    return email_validator.caching_resolver()
+
+
+def _count_word(text: str, word: str) -> int:
+    """
+    Same result as ``text.split().count(word)`` without tokenizing the whole text when the word is rare.
+
+    The candidates are found with ``str.count``/``str.find`` (C speed) and only their boundaries are checked in
+    Python; when the word is frequent enough for that loop to cost more than the split, the split is used.
+    """
+    if not word or word.split() != [word]:
+        return 0  # empty or containing whitespace: never equal to a token
+
+    occurrences = text.count(word)
+    if occurrences == 0:
+        return 0
+    if occurrences > len(text) >> 6:
+        return text.split().count(word)
+
+    count = 0
+    size = len(word)
+    end = len(text)
+    find = text.find
+    index = find(word)
+    while index != -1:
+        stop = index + size
+        if (index == 0 or text[index - 1].isspace()) and (stop == end or text[stop].isspace()):
+            count += 1
+        index = find(word, stop)
+    return count
+
+
+def _search_word(origin_text: str, searched_word: str, case_sensitivy: bool) -> int:
+    """``search_by="word"``: number of whitespace-separated tokens equal to the searched word."""
+    if case_sensitivy:
+        return _count_word(origin_text, searched_word)
+    return _count_word(origin_text.lower(), searched_word.lower())
+
+
+def _search_string(origin_text: str, searched_word: str, case_sensitivy: bool) -> int:
+    """``search_by="string"``: number of (non-overlapping) occurrences of the substring."""
+    # A needle without cased characters (digits, punctuation...) matches the same either way,
+    # so the lowercased copy of the whole text is only built when it can change the result
+    if case_sensitivy or searched_word.lower() == searched_word.upper():
+        return origin_text.count(searched_word)
+    return origin_text.lower().count(searched_word.lower())
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_search_pattern(pattern: str, case_sensitivy: bool) -> re.Pattern:
+    """Compiled pattern for ``search_by="regex"``, cached across calls."""
+    return re.compile(pattern, 0 if case_sensitivy else re.IGNORECASE)
+
+
+def _search_regex(origin_text: str, searched_word: str, case_sensitivy: bool) -> int:
+    """``search_by="regex"``: number of (non-overlapping) matches of the pattern."""
+    return sum(1 for _ in _compile_search_pattern(searched_word, case_sensitivy).finditer(origin_text))
+
+
+# search_by mode -> counting function
+_SEARCHERS = {"word": _search_word, "string": _search_string, "regex": _search_regex}
+
 
 class ValidateError(Exception):
     """Custom exception for Validate errors."""
@@ -77,16 +152,6 @@ class Validate:
         }
         """
 
-        # Local Variables
-        result: dict = {
-            "success": bool,
-            "valid_emails": list,
-            "invalid_emails": list,
-            "qt_valids": int,
-            "qt_invalids": int,
-            "map_validation": list[dict],
-        }
-
         # Preprocessing
         validated_emails: list = []
         invalid_emails: list = []
@@ -94,14 +159,34 @@ class Validate:
 
         # Process
         try:
-            for email in email_list:
-                try:
-                    v = email_validator.validate_email(email)
-                    validated_emails.append(email)
-                    map_validation.append(v)
+            # Looked up once instead of on every iteration
+            prefilter = _EMAIL_PREFILTER.fullmatch
+            validate_email = email_validator.validate_email
+            not_valid_error = email_validator.EmailNotValidError
+            resolver = _dns_resolver()
+            add_valid = validated_emails.append
+            add_invalid = invalid_emails.append
+            add_validation = map_validation.append
+            # Repeated addresses (common in exported lists) are validated once; None marks an invalid one
+            checked: dict = {}
 
-                except email_validator.EmailNotValidError:
-                    invalid_emails.append(email)
+            for email in email_list:
+                if email in checked:
+                    v = checked[email]
+                else:
+                    v = None
+                    if prefilter(email) is not None:
+                        try:
+                            v = validate_email(email, dns_resolver=resolver)
+                        except not_valid_error:
+                            pass
+                    checked[email] = v
+
+                if v is None:
+                    add_invalid(email)
+                else:
+                    add_valid(email)
+                    add_validation(v)
 
             if verbose:
                 success_print(f"Function: {self.emails.__name__} executed.")
@@ -147,7 +232,7 @@ class Validate:
             Search mode. Accepts:
             - 'string' - finds the requested substring (default)
             - 'word' - finds only the exact word
-            - 'regex' - finds regex patterns [UNDER DEVELOPMENT]
+            - 'regex' - finds matches of a regex pattern
             Default: "string".
 
         verbose : bool, optional
@@ -172,36 +257,22 @@ class Validate:
         # Local Variables
         result: dict = {"is_found": False, "number_occurrences": 0, "positions": []}
 
-        # Preprocessing
-        result["is_found"] = False
-
         # Process
         try:
-            if search_by == "word":
-                origin_words = origin_text.split()
-                try:
-                    if case_sensitivy:
-                        result["number_occurrences"] = origin_words.count(searched_word)
-                        result["is_found"] = result["number_occurrences"] > 0
-                    else:
-                        words_lowercase = [word.lower() for word in origin_words]
-                        searched_word_lower = searched_word.lower()
-                        result["number_occurrences"] = words_lowercase.count(searched_word_lower)
-                        result["is_found"] = result["number_occurrences"] > 0
+            searcher = _SEARCHERS.get(search_by)
 
-                except Exception as e:
-                    raise ValidateError(f"Unable to complete the search: {searched_word}. Error: {str(e)}") from e
+            # Nothing to find: an empty needle, or one longer than the text (lowercasing can only change lengths
+            # outside ASCII), so neither the search nor the lowercased copy of the text is needed. Regex patterns
+            # are excluded: their length says nothing about the length of their matches
+            nothing_to_find = search_by != "regex" and (
+                not searched_word
+                or (len(searched_word) > len(origin_text) and (case_sensitivy or origin_text.isascii()))
+            )
 
-            elif search_by == "string":
+            if searcher is not None and not nothing_to_find:
                 try:
-                    if case_sensitivy:
-                        result["number_occurrences"] = origin_text.count(searched_word)
-                        result["is_found"] = result["number_occurrences"] > 0
-                    else:
-                        origin_text_lower = origin_text.lower()
-                        searched_word_lower = searched_word.lower()
-                        result["number_occurrences"] = origin_text_lower.count(searched_word_lower)
-                        result["is_found"] = result["number_occurrences"] > 0
+                    result["number_occurrences"] = searcher(origin_text, searched_word, case_sensitivy)
+                    result["is_found"] = result["number_occurrences"] > 0
 
                 except Exception as e:
                     raise ValidateError(f"Unable to complete the search: {searched_word}. Error: {str(e)}") from e
@@ -222,3 +293,78 @@ class Validate:
                 )
 
         return result
+
+    def words(  # pylint: disable=too-many-positional-arguments
+        self,
+        origin_text: str,
+        searched_words: list[str],
+        case_sensitivy: bool = True,
+        search_by: str = "word",
+        verbose: bool = False,
+    ) -> dict:
+        """
+        Counts several words, substrings or patterns within a provided text, preparing the text only once.
+
+        Use it instead of calling ``word()`` in a loop when many words are searched in the same text: the text is
+        split (``"word"``) or lowercased (case insensitive ``"string"``) once for all of them.
+
+        Parameters:
+        -----------
+        origin_text : str
+            The text where the search should be performed.
+
+        searched_words : list[str]
+            The words to search for.
+
+        case_sensitivy : bool, optional
+            If True, the search is case sensitive. Default: True.
+
+        search_by : str, optional
+            Search mode, as in ``word()``: 'word' (default), 'string' or 'regex'.
+
+        verbose : bool, optional
+            If True, prints a success message after execution. Default: False.
+
+        Returns:
+        --------
+        dict
+            Dictionary mapping each searched word to its number of occurrences (0 for an unknown search mode).
+
+        Example:
+        --------
+        >>> from rpa_suite.core.validate import Validate
+        >>> v = Validate()
+        >>> v.words("Hello world, hello!", ["hello", "bye"], case_sensitivy=False)
+        {'hello': 1, 'bye': 0}
+        """
+
+        # Process
+        try:
+            if search_by == "word":
+                if case_sensitivy:
+                    counter = Counter(origin_text.split())
+                    result = {word: counter[word] for word in searched_words}
+                else:
+                    counter = Counter(origin_text.lower().split())
+                    result = {word: counter[word.lower()] for word in searched_words}
+
+            elif search_by == "string":
+                text = origin_text if case_sensitivy else origin_text.lower()
+                result = {
+                    word: text.count(word if case_sensitivy else word.lower()) if word else 0 for word in searched_words
+                }
+
+            elif search_by == "regex":
+                result = {pattern: _search_regex(origin_text, pattern, case_sensitivy) for pattern in searched_words}
+
+            else:
+                result = dict.fromkeys(searched_words, 0)
+
+        except Exception as e:
+            raise ValidateError(f"Unable to search for: {searched_words}. Error: {str(e)}") from e
+
+        # Postprocessing
+        if verbose:
+            success_print(f"Function: {self.words.__name__} executed.")
+
+        return result
@@ -66,6 +66,12 @@ def __create_ss_dir(
         # Monta o caminho para o novo diretório
         full_path: str = os.path.join(path_to_create, name_ss_dir)
 
+        # Caso comum (chamado a cada screenshot): o diretório já existe, basta um stat, sem makedirs + exceção
+        if os.path.isdir(full_path):
+            result["success"] = False
+            result["path_created"] = full_path
+            return result
+
         # Tenta criar o diretório
         try:
             os.makedirs(full_path, exist_ok=False)
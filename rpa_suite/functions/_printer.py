@@ -1,26 +1,50 @@
 # rpa_suite/functions/_printer.py
 
-# imports external
-from colorama import Fore
+# ANSI color codes, the same strings as colorama's Fore.*: colorama is never init()'ed by the suite, so its constants
+# are spelled out instead of importing the package (and its Windows console wrappers) on every import
+
+# Reset to the default console color, appended after every colored message
+_RESET = "\x1b[37m"
 
 
 # Windows bash colors
-class Colors:  # pylint: disable=duplicate-code
-    black = f"{Fore.BLACK}"
-    blue = f"{Fore.BLUE}"
-    green = f"{Fore.GREEN}"
-    cyan = f"{Fore.CYAN}"
-    red = f"{Fore.RED}"
-    magenta = f"{Fore.MAGENTA}"
-    yellow = f"{Fore.YELLOW}"
-    white = f"{Fore.WHITE}"
-    default = f"{Fore.WHITE}"
-    call_fn = f"{Fore.LIGHTMAGENTA_EX}"
-    retur_fn = f"{Fore.LIGHTYELLOW_EX}"
-
-
-# pylint: disable=duplicate-code
-def success_print(string_text: str, color=Colors.green, ending="\n") -> None:
+class Colors:
+    """Color constants for console output formatting, shared by the print helpers, Print and Suite."""
+
+    black = "\x1b[30m"
+    blue = "\x1b[34m"
+    green = "\x1b[32m"
+    cyan = "\x1b[36m"
+    red = "\x1b[31m"
+    magenta = "\x1b[35m"
+    yellow = "\x1b[33m"
+    white = "\x1b[37m"
+    default = _RESET
+    call_fn = "\x1b[95m"
+    retur_fn = "\x1b[93m"
+
+
+def _make_printer(name: str, default_color: str, doc: str):
+    """
+    Builds one of the colored print functions below; the reset suffix is bound once, at import time.
+
+    pt-br
+    ----------
+    Cria uma das funções de print coloridas abaixo; o sufixo de reset é definido uma única vez, na importação.
+    """
+    suffix = _RESET
+
+    def printer(string_text: str, color=default_color, ending="\n") -> None:
+        print(f"{color}{string_text}{suffix}", end=ending)
+
+    printer.__name__ = printer.__qualname__ = name
+    printer.__doc__ = doc
+    return printer
+
+
+success_print = _make_printer(
+    "success_print",
+    Colors.green,
     """
     Print that indicates ``SUCCESS``. Customized with the color Green \n
 
@@ -35,12 +59,12 @@ def success_print(string_text: str, color=Colors.green, ending="\n") -> None:
     Retorno:
     ----------
         >>> type:None
-    """
-    print(f"{color}{string_text}{Colors.default}", end=ending)
+    """,
+)
 
-
-# pylint: disable=duplicate-code
-def alert_print(string_text: str, color=Colors.yellow, ending="\n") -> None:
+alert_print = _make_printer(
+    "alert_print",
+    Colors.yellow,
     """
     Print that indicates ``ALERT``. Customized with the color Yellow \n
 
@@ -54,12 +78,12 @@ def alert_print(string_text: str, color=Colors.yellow, ending="\n") -> None:
     Retorno:
     ----------
         >>> type:None
-    """
-    print(f"{color}{string_text}{Colors.default}", end=ending)
+    """,
+)
 
-
-# pylint: disable=duplicate-code
-def info_print(string_text: str, color=Colors.cyan, ending="\n") -> None:
+info_print = _make_printer(
+    "info_print",
+    Colors.cyan,
     """
     Print that indicates ``INFORMATION``. Customized with the color Cyan \n
 
@@ -73,12 +97,12 @@ def info_print(string_text: str, color=Colors.cyan, ending="\n") -> None:
     Retorno:
     ----------
         >>> type:None
-    """
-    print(f"{color}{string_text}{Colors.default}", end=ending)
+    """,
+)
 
-
-# pylint: disable=duplicate-code
-def error_print(string_text: str, color=Colors.red, ending="\n") -> None:
+error_print = _make_printer(
+    "error_print",
+    Colors.red,
     """
     Print that indicates ``ERROR``. Customized with the color Red \n
 
@@ -92,12 +116,12 @@ def error_print(string_text: str, color=Colors.red, ending="\n") -> None:
     Retorno:
     ----------
         >>> type:None
-    """
-    print(f"{color}{string_text}{Colors.default}", end=ending)
-
+    """,
+)
 
-# pylint: disable=duplicate-code
-def magenta_print(string_text: str, color=Colors.magenta, ending="\n") -> None:
+magenta_print = _make_printer(
+    "magenta_print",
+    Colors.magenta,
     """
     Print customized with the color Magenta \n
 
@@ -111,12 +135,12 @@ def magenta_print(string_text: str, color=Colors.magenta, ending="\n") -> None:
     Retorno:
     ----------
         >>> type:None
-    """
-    print(f"{color}{string_text}{Colors.default}", end=ending)
-
+    """,
+)
 
-# pylint: disable=duplicate-code
-def blue_print(string_text: str, color=Colors.blue, ending="\n") -> None:
+blue_print = _make_printer(
+    "blue_print",
+    Colors.blue,
     """
     Print customized with the color Blue \n
 
@@ -130,12 +154,12 @@ def blue_print(string_text: str, color=Colors.blue, ending="\n") -> None:
     Retorno:
     ----------
         >>> type:None
-    """
-    print(f"{color}{string_text}{Colors.default}", end=ending)
-
+    """,
+)
 
-# pylint: disable=duplicate-code
-def print_call_fn(string_text: str, color=Colors.call_fn, ending="\n") -> None:
+print_call_fn = _make_printer(
+    "print_call_fn",
+    Colors.call_fn,
     """
     Print customized for function called (log) \n
     Color: Magenta Light
@@ -150,12 +174,12 @@ def print_call_fn(string_text: str, color=Colors.call_fn, ending="\n") -> None:
     Retorno:
     ----------
         >>> type:None
-    """
-    print(f"{color}{string_text}{Colors.default}", end=ending)
-
+    """,
+)
 
-# pylint: disable=duplicate-code
-def print_retur_fn(string_text: str, color=Colors.retur_fn, ending="\n") -> None:
+print_retur_fn = _make_printer(
+    "print_retur_fn",
+    Colors.retur_fn,
     """
     Print customized for function return (log) \n
     Color: Yellow Light
@@ -170,5 +194,5 @@ def print_retur_fn(string_text: str, color=Colors.retur_fn, ending="\n") -> None
     Retorno:
     ----------
         >>> type:None
-    """
-    print(f"{color}{string_text}{Colors.default}", end=ending)
+    """,
+)
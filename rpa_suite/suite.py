@@ -2,6 +2,7 @@
 
 # imports internal
 import hashlib
+import importlib.util
 
 # imports third-party
 import subprocess
@@ -9,9 +10,6 @@ import sys
 from importlib.metadata import version
 from typing import TYPE_CHECKING, Optional
 
-# imports external
-from colorama import Fore
-
 from .core.asyncrun import AsyncRunner
 from .core.clock import Clock
 from .core.database import Database
@@ -24,6 +22,7 @@ from .core.parallel import ParallelRunner
 from .core.print import Print
 from .core.regex import Regex
 from .core.validate import Validate
+from .functions._printer import _RESET, Colors
 
 if TYPE_CHECKING:
     from .core.artemis import Artemis
@@ -38,37 +37,67 @@ class SuiteError(Exception):
         super().__init__(f"SuiteError: {message}")
 
 
-# Windows bash colors
-class Colors:  # pylint: disable=duplicate-code
-    """
-    This class provides color constants based on the colorama library,
-    allowing for visual formatting of texts in the Windows terminal.
-
-    Attributes:
-        black (str): Black color
-        blue (str): Blue color
-        green (str): Green color
-        cyan (str): Cyan color
-        red (str): Red color
-        magenta (str): Magenta color
-        yellow (str): Yellow color
-        white (str): White color
-        default (str): Default color (white)
-        call_fn (str): Light magenta color (used for function calls)
-        retur_fn (str): Light yellow color (used for function returns)
-    """
+def _load_browser() -> Optional[type["Browser"]]:
+    """Browser class, if selenium and webdriver_manager are installed."""
+    if importlib.util.find_spec("selenium") and importlib.util.find_spec("webdriver_manager"):
+        from .core.browser import Browser  # pylint: disable=import-outside-toplevel
+
+        return Browser
+    return None
+
+
+def _load_iris() -> Optional[type["Iris"]]:
+    """Iris class, if docling is installed."""
+    if importlib.util.find_spec("docling"):
+        from .core.iris import Iris  # pylint: disable=import-outside-toplevel
+
+        return Iris
+    return None
+
+
+def _load_artemis() -> Optional[type["Artemis"]]:
+    """Artemis class, if pyautogui is installed."""
+    if importlib.util.find_spec("pyautogui"):
+        from .core.artemis import Artemis  # pylint: disable=import-outside-toplevel
+
+        return Artemis
+    return None
+
+
+def _load_database() -> Optional[type[Database]]:
+    """Database class (not instance, following type[Object] pattern), if any database library is available."""
+    if (
+        importlib.util.find_spec("sqlite3")
+        or importlib.util.find_spec("psycopg2")
+        or importlib.util.find_spec("pymysql")
+    ):
+        return Database
+    return None
+
+
+# Optional submodules of Suite: looked up (find_spec + import) only when first accessed
+_OPTIONAL_SUBMODULES = {
+    "browser": _load_browser,
+    "iris": _load_iris,
+    "artemis": _load_artemis,
+    "database": _load_database,
+}
+
 
-    black = f"{Fore.BLACK}"
-    blue = f"{Fore.BLUE}"
-    green = f"{Fore.GREEN}"
-    cyan = f"{Fore.CYAN}"
-    red = f"{Fore.RED}"
-    magenta = f"{Fore.MAGENTA}"
-    yellow = f"{Fore.YELLOW}"
-    white = f"{Fore.WHITE}"
-    default = f"{Fore.WHITE}"
-    call_fn = f"{Fore.LIGHTMAGENTA_EX}"
-    retur_fn = f"{Fore.LIGHTYELLOW_EX}"
+def _make_print_method(name: str, default_color: str, doc: str):
+    """Builds one of Suite's colored print methods, which differ only in their default color."""
+
+    # pylint: disable-next=unused-argument
+    def print_method(self, string_text: str, color=default_color, ending="\n") -> None:
+        # One write instead of print()'s two; sys.stdout is read per call so redirect_stdout/capture still work
+        stdout = sys.stdout
+        if stdout is not None:  # no console (pythonw): print() silently does nothing too
+            stdout.write(f"{color}{string_text}{_RESET}{ending}")
+
+    print_method.__name__ = name
+    print_method.__qualname__ = f"Suite.{name}"
+    print_method.__doc__ = doc
+    return print_method
 
 
 class Suite:
@@ -116,13 +145,16 @@ class Suite:
     except Exception:
         __version__ = "unknown"
 
-    __id_hash__ = "rpa_suite"
+    # The version never changes at runtime: hashed once, when the class is created, and shared by every instance
+    __id_hash__ = hashlib.sha256(__version__.encode()).hexdigest()
 
-    def __init__(self):
-        # Initialize instance hash
-        self.__id_hash__ = "rpa_suite"
-        self.__id_hash__ = hashlib.sha256(self.__version__.encode()).hexdigest()
+    # Optional submodules: resolved on first access (see __getattr__), None when their libraries are missing
+    browser: Optional[type["Browser"]]
+    iris: Optional[type["Iris"]]
+    artemis: Optional[type["Artemis"]]
+    database: Optional[type[Database]]
 
+    def __init__(self):
         # SUBMODULES - Object instances
         self.clock: type[Clock] = Clock()
         self.date: type[Date] = Date()
@@ -138,113 +170,93 @@ class Suite:
         self.parallel: type[ParallelRunner] = ParallelRunner
         self.asyn: type[AsyncRunner] = AsyncRunner
 
-        # Conditional import for optional modules
-        import importlib.util  # pylint: disable=import-outside-toplevel
-
-        # Browser - conditional import
-        if importlib.util.find_spec("selenium") and importlib.util.find_spec("webdriver_manager"):
-            from .core.browser import Browser  # pylint: disable=import-outside-toplevel
-
-            self.browser: type[Browser] = Browser
-        else:
-            self.browser: Optional[type["Browser"]] = None
-
-        # Iris - conditional import
-        if importlib.util.find_spec("docling"):
-            from .core.iris import Iris  # pylint: disable=import-outside-toplevel
-
-            self.iris: type[Iris] = Iris
-        else:
-            self.iris: Optional[type["Iris"]] = None
-
-        # Artemis - conditional import
-        if importlib.util.find_spec("pyautogui"):
-            from .core.artemis import Artemis  # pylint: disable=import-outside-toplevel
-
-            self.artemis: type[Artemis] = Artemis
-        else:
-            self.artemis: Optional[type["Artemis"]] = None
-
-        # Database - Database class (not instance, following type[Object] pattern)
-        # Check if any database library is available
-        if (
-            importlib.util.find_spec("sqlite3")
-            or importlib.util.find_spec("psycopg2")
-            or importlib.util.find_spec("pymysql")
-        ):
-            self.database: type[Database] = Database
-        else:
-            self.database: Optional[type[Database]] = None
-
-    # pylint: disable=duplicate-code
-    def success_print(self, string_text: str, color=Colors.green, ending="\n") -> None:
+        # Optional modules (browser, iris, artemis, database) are resolved on first access, see __getattr__
+
+    def __getattr__(self, name: str):
+        # Only called when the normal lookup fails, i.e. on the first access to an optional submodule: the
+        # find_spec checks and imports run then, and the result is stored on the instance for later accesses
+        loader = _OPTIONAL_SUBMODULES.get(name)
+        if loader is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = loader()
+        self.__dict__[name] = value
+        return value
+
+    success_print = _make_print_method(
+        "success_print",
+        Colors.green,
         """
         Print that indicates ``SUCCESS``. Customized with the color Green.
 
         Returns:
         --------
             None
-        """
-
-        print(f"{color}{string_text}{Colors.default}", end=ending)
+        """,
+    )
 
-    # pylint: disable=duplicate-code
-    def alert_print(self, string_text: str, color=Colors.yellow, ending="\n") -> None:
+    alert_print = _make_print_method(
+        "alert_print",
+        Colors.yellow,
         """
         Print that indicates ``ALERT``. Customized with the color Yellow.
 
         Returns:
         --------
             None
-        """
-        print(f"{color}{string_text}{Colors.default}", end=ending)
+        """,
+    )
 
-    # pylint: disable=duplicate-code
-    def info_print(self, string_text: str, color=Colors.cyan, ending="\n") -> None:
+    info_print = _make_print_method(
+        "info_print",
+        Colors.cyan,
         """
         Print that indicates ``INFORMATION``. Customized with the color Cyan.
 
         Returns:
         --------
             None
-        """
-        print(f"{color}{string_text}{Colors.default}", end=ending)
+        """,
+    )
 
-    # pylint: disable=duplicate-code
-    def error_print(self, string_text: str, color=Colors.red, ending="\n") -> None:
+    error_print = _make_print_method(
+        "error_print",
+        Colors.red,
         """
         Print that indicates ``ERROR``. Customized with the color Red.
 
         Returns:
         --------
             None
-        """
-        print(f"{color}{string_text}{Colors.default}", end=ending)
+        """,
+    )
 
-    # pylint: disable=duplicate-code
-    def magenta_print(self, string_text: str, color=Colors.magenta, ending="\n") -> None:
+    magenta_print = _make_print_method(
+        "magenta_print",
+        Colors.magenta,
         """
         Print customized with the color Magenta.
 
         Returns:
         --------
             None
-        """
-        print(f"{color}{string_text}{Colors.default}", end=ending)
+        """,
+    )
 
-    # pylint: disable=duplicate-code
-    def blue_print(self, string_text: str, color=Colors.blue, ending="\n") -> None:
+    blue_print = _make_print_method(
+        "blue_print",
+        Colors.blue,
         """
         Print customized with the color Blue.
 
         Returns:
         --------
             None
-        """
-        print(f"{color}{string_text}{Colors.default}", end=ending)
+        """,
+    )
 
-    # pylint: disable=duplicate-code
-    def print_call_fn(self, string_text: str, color=Colors.call_fn, ending="\n") -> None:
+    print_call_fn = _make_print_method(
+        "print_call_fn",
+        Colors.call_fn,
         """
         Print customized for function called (log).
         Color: Magenta Light
@@ -252,11 +264,12 @@ class Suite:
         Returns:
         --------
             None
-        """
-        print(f"{color}{string_text}{Colors.default}", end=ending)
+        """,
+    )
 
-    # pylint: disable=duplicate-code
-    def print_retur_fn(self, string_text: str, color=Colors.retur_fn, ending="\n") -> None:
+    print_retur_fn = _make_print_method(
+        "print_retur_fn",
+        Colors.retur_fn,
         """
         Print customized for function return (log).
         Color: Yellow Light
@@ -264,8 +277,8 @@ class Suite:
         Returns:
         --------
             None
-        """
-        print(f"{color}{string_text}{Colors.default}", end=ending)
+        """,
+    )
 
     def __install_all_libs(self):  # pylint: disable=unused-private-member
         """
@@ -273,6 +286,8 @@ class Suite:
         including all features such as OCR and AI agent.
         """
 
+        # "typing" and "sqlite3" are part of the standard library (and not installable from PyPI on Python 3),
+        # listing them would make the single pip call below fail every time
         libs = [
             "colorama",
             "colorlog",
@@ -280,19 +295,35 @@ class Suite:
             "loguru",
             "pyautogui",
             "selenium",
-            "typing",
             "webdriver_manager",
             "docling",
-            "sqlite3",
         ]
+        pip_install = [sys.executable, "-m", "pip", "install", "--disable-pip-version-check", "--no-input"]
+
+        # One pip run resolves and installs everything at once
+        try:
+            subprocess.check_call([*pip_install, *libs])
+            self.success_print("Suite RPA: All libraries installed successfully!")
+            return
+
+        except subprocess.CalledProcessError:
+            self.alert_print("Suite RPA: Installing the libraries together failed, retrying one by one...")
 
+        # Fallback: one run per library, to report which one fails
         for lib in libs:
             try:
-                subprocess.check_call([sys.executable, "-m", "pip", "install", lib])
+                subprocess.check_call([*pip_install, lib])
                 self.success_print(f"Suite RPA: Library {lib} installed successfully!")
 
             except subprocess.CalledProcessError:
                 self.error_print(f"Suite RPA: Error installing library {lib}")
 
 
-rpa = Suite()
+def __getattr__(name: str):
+    # The shared Suite instance is built on the first access to ``rpa`` (PEP 562), not at import time, and then
+    # stored as a regular module attribute so later accesses don't come back here
+    if name == "rpa":
+        rpa = Suite()
+        globals()["rpa"] = rpa
+        return rpa
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,15 @@
 from setuptools import find_packages, setup
 
+with open("README.md", encoding="utf-8") as readme:
+    LONG_DESCRIPTION = readme.read()
+
 setup(
     name="rpa_suite",
     version="1.6.6",
     packages=find_packages(),
     description="Comprehensive Python toolkit for RPA automation: email, logging, database tracking, browser automation, OCR, desktop automation, and more. Essential utilities for building robust automation workflows with Selenium, Botcity, and custom solutions.",
     long_description_content_type="text/markdown",
-    long_description=open("README.md", encoding="utf-8").read(),  # pylint: disable=consider-using-with
+    long_description=LONG_DESCRIPTION,
     author="Camilo Costa de Carvalho",
     author_email="camilo.costa1993@gmail.com",
     license="MIT",